@@ -6,10 +6,129 @@ pour tous les modèles de l'application SoftDesk.
 """
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from datetime import timedelta
+from django.db.models.functions import Length, Substr
+from django.utils import timezone
 from .models import User, Project, Contributor, Issue, Comment
 
 
+class LightChangeList(ChangeList):
+    """
+    ChangeList qui délègue à l'admin l'allègement de la requête de liste.
+
+    Permet de différer les colonnes lourdes uniquement pour la liste,
+    sans pénaliser le formulaire d'édition qui en a besoin.
+    """
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return self.model_admin.get_changelist_queryset(queryset)
+
+
+class LightChangeListMixin:
+    """
+    OPTIMISATION: Point d'extension pour alléger la requête de la liste admin.
+
+    Les admins surchargent get_changelist_queryset() pour différer ou annoter
+    des colonnes affichées uniquement dans la liste.
+    """
+
+    def get_changelist(self, request, **kwargs):
+        return LightChangeList
+
+    def get_changelist_queryset(self, queryset):
+        """
+        Ajuste la requête de la liste après filtres, recherche et tri.
+
+        Args:
+            queryset: QuerySet de la liste déjà filtré et trié
+
+        Returns:
+            QuerySet: Le queryset ajusté (inchangé par défaut)
+        """
+        return queryset
+
+
+class CreatedTimeRangeFilter(admin.SimpleListFilter):
+    """
+    Filtre de la liste admin par plage de date de création.
+
+    OPTIMISATION: Remplace date_hierarchy, qui exécute à chaque affichage un
+    SELECT DISTINCT des dates (ou MIN/MAX) sur toute la sélection. Les plages
+    proposées sont fixes et se traduisent par un seul prédicat
+    created_time >= début, servi par les index *_ct_idx (parcours d'index borné).
+    """
+    title = "Date de création"
+    parameter_name = 'created'
+
+    def lookups(self, request, model_admin):
+        """
+        Plages proposées dans la barre latérale (aucune requête).
+
+        Args:
+            request: Requête HTTP courante
+            model_admin: Admin du modèle filtré
+
+        Returns:
+            tuple: Couples (valeur du paramètre, libellé)
+        """
+        return (
+            ('today', "Aujourd'hui"),
+            ('last_7_days', "7 derniers jours"),
+            ('last_30_days', "30 derniers jours"),
+            ('this_year', "Cette année"),
+        )
+
+    def queryset(self, request, queryset):
+        """
+        Restreint la liste aux éléments créés depuis le début de la plage choisie.
+
+        Args:
+            request: Requête HTTP courante
+            queryset: QuerySet de la liste
+
+        Returns:
+            QuerySet: Le queryset filtré sur created_time (inchangé sans plage)
+        """
+        now = timezone.localtime()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        starts = {
+            'today': today,
+            'last_7_days': now - timedelta(days=7),
+            'last_30_days': now - timedelta(days=30),
+            'this_year': today.replace(month=1, day=1),
+        }
+        start = starts.get(self.value())
+        if start is None:
+            return queryset
+        return queryset.filter(created_time__gte=start)
+
+
+def make_status_action(status, label):
+    """
+    Fabrique une action en lot qui change le statut des issues sélectionnées.
+
+    OPTIMISATION: Une seule requête UPDATE pour toute la sélection.
+    updated_time est renseigné explicitement car auto_now n'est pas appliqué
+    par QuerySet.update().
+
+    Args:
+        status (str): Code du statut à appliquer (ex: 'TO_DO')
+        label (str): Libellé du statut affiché à l'utilisateur
+
+    Returns:
+        function: Action d'admin nommée mark_as_<statut>
+    """
+    def action(modeladmin, request, queryset):
+        updated = queryset.update(status=status, updated_time=timezone.now())
+        modeladmin.message_user(request, f'{updated} issue(s) marquée(s) comme "{label}".')
+    action.__name__ = f'mark_as_{status.lower()}'
+    action.short_description = f"Marquer comme '{label}'"
+    return action
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """
@@ -50,7 +169,7 @@ class UserAdmin(BaseUserAdmin):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(LightChangeListMixin, admin.ModelAdmin):
     """
     Configuration de l'admin pour le modèle Project.
 
@@ -61,7 +180,9 @@ class ProjectAdmin(admin.ModelAdmin):
     list_display = ('name', 'type', 'author', 'contributors_count', 'created_time')
 
     # Filtres disponibles
-    list_filter = ('type', 'created_time', 'author')
+    # OPTIMISATION: pas de filtre 'author' (liste de tous les utilisateurs à chaque
+    # affichage) ; la recherche sur author__username le remplace
+    list_filter = ('type', CreatedTimeRangeFilter)
 
     # Champs de recherche
     search_fields = ('name', 'description', 'author__username')
@@ -80,25 +201,40 @@ class ProjectAdmin(admin.ModelAdmin):
         }),
     )
 
-    # Filtres par date
-    date_hierarchy = 'created_time'
+    # OPTIMISATION: Pas de date_hierarchy (voir CreatedTimeRangeFilter)
 
     # Nombre d'éléments par page
     list_per_page = 25
 
-    def contributors_count(self, obj):
+    # OPTIMISATION: Pas de second COUNT sur toute la table ("X sur Y au total")
+    show_full_result_count = False
+
+    def get_queryset(self, request):
         """
-        Calcule et affiche le nombre de contributeurs du projet.
+        OPTIMISATION: Précharge l'auteur affiché dans la liste et le formulaire.
+
+        Le nombre de contributeurs est lu directement depuis la colonne
+        dénormalisée Project.contributors_count (aucun COUNT par ligne).
 
         Args:
-            obj (Project): Instance du modèle Project
+            request: Requête HTTP courante
 
         Returns:
-            int: Nombre de contributeurs
+            QuerySet: Projets avec auteur préchargé
         """
-        return obj.contributors.count()
-    contributors_count.short_description = 'Contributeurs'
-    contributors_count.admin_order_field = 'contributors'
+        return super().get_queryset(request).select_related('author')
+
+    def get_changelist_queryset(self, queryset):
+        """
+        OPTIMISATION: Diffère la description, non affichée dans la liste.
+
+        Args:
+            queryset: QuerySet de la liste des projets
+
+        Returns:
+            QuerySet: Projets sans la colonne description
+        """
+        return queryset.defer('description')
 
 
 @admin.register(Contributor)
@@ -113,13 +249,15 @@ class ContributorAdmin(admin.ModelAdmin):
     list_display = ('user', 'project', 'created_time')
 
     # Filtres disponibles
-    list_filter = ('created_time', 'project__type')
+    list_filter = (CreatedTimeRangeFilter, 'project__type')
 
     # Champs de recherche
     search_fields = ('user__username', 'project__name')
 
     # Champs en lecture seule
     readonly_fields = ('created_time',)
+    # OPTIMISATION: Calculé une fois, user et project figés après création
+    readonly_fields_on_change = readonly_fields + ('user', 'project')
 
     # Organisation des champs
     fieldsets = (
@@ -132,12 +270,31 @@ class ContributorAdmin(admin.ModelAdmin):
         }),
     )
 
-    # Filtres par date
-    date_hierarchy = 'created_time'
+    # OPTIMISATION: Pas de date_hierarchy (voir CreatedTimeRangeFilter)
+
+    # OPTIMISATION: Pas de second COUNT sur toute la table ("X sur Y au total")
+    show_full_result_count = False
 
     # Autocomplete pour les relations (améliore les performances)
     autocomplete_fields = ('user', 'project')
 
+    # OPTIMISATION: Jointure unique pour les colonnes de la liste (évite le N+1)
+    list_select_related = ('user', 'project')
+
+    def get_queryset(self, request):
+        """
+        OPTIMISATION: Précharge les relations affichées (liste et formulaire).
+
+        Args:
+            request: Requête HTTP courante
+
+        Returns:
+            QuerySet: Contributeurs avec relations préchargées
+        """
+        return super().get_queryset(request).select_related(
+            'user', 'project', 'project__author'
+        )
+
     # Prévention des doublons via l'admin
     def get_readonly_fields(self, request, obj=None):
         """
@@ -154,12 +311,12 @@ class ContributorAdmin(admin.ModelAdmin):
             tuple: Champs en lecture seule
         """
         if obj:  # Si on modifie un contributeur existant
-            return self.readonly_fields + ('user', 'project')
+            return self.readonly_fields_on_change
         return self.readonly_fields
 
 
 @admin.register(Issue)
-class IssueAdmin(admin.ModelAdmin):
+class IssueAdmin(LightChangeListMixin, admin.ModelAdmin):
     """
     Configuration de l'admin pour le modèle Issue.
 
@@ -175,7 +332,7 @@ class IssueAdmin(admin.ModelAdmin):
     # Filtres disponibles dans la sidebar
     list_filter = (
         'priority', 'tag', 'status', 'project__type',
-        'created_time', 'updated_time'
+        CreatedTimeRangeFilter, 'updated_time'
     )
 
     # Champs de recherche
@@ -205,8 +362,7 @@ class IssueAdmin(admin.ModelAdmin):
     # Champs en lecture seule
     readonly_fields = ('created_time', 'updated_time')
 
-    # Filtres par date
-    date_hierarchy = 'created_time'
+    # OPTIMISATION: Pas de date_hierarchy (voir CreatedTimeRangeFilter)
 
     # Tri par défaut
     ordering = ('-created_time',)
@@ -214,60 +370,68 @@ class IssueAdmin(admin.ModelAdmin):
     # Pagination
     list_per_page = 25
 
+    # OPTIMISATION: Pas de second COUNT sur toute la table ("X sur Y au total")
+    show_full_result_count = False
+
     # Autocomplete pour les relations (améliore les performances)
-    autocomplete_fields = ('project', 'author', 'assignee')
+    autocomplete_fields = ('project', 'author')
+
+    # OPTIMISATION: Saisie par ID pour l'assigné (pas de requête AJAX ni Select2)
+    raw_id_fields = ('assignee',)
+
+    # OPTIMISATION: Jointure unique pour les colonnes de la liste (évite le N+1)
+    list_select_related = ('project', 'author', 'assignee')
 
-    # Actions personnalisées
-    actions = ['mark_as_to_do', 'mark_as_in_progress', 'mark_as_finished']
+    # Actions personnalisées : une action par statut (mark_as_to_do, ...)
+    actions = [make_status_action(code, label) for code, label in Issue.STATUS_CHOICES]
 
-    def mark_as_to_do(self, request, queryset):
+    def get_queryset(self, request):
         """
-        Action en lot pour marquer les issues sélectionnées comme 'À faire'.
+        OPTIMISATION: Précharge les relations affichées (liste et formulaire).
 
         Args:
-            request: Requête HTTP de l'admin
-            queryset: Issues sélectionnées par l'utilisateur
+            request: Requête HTTP courante
 
         Returns:
-            None: Affiche un message de confirmation via self.message_user
+            QuerySet: Issues avec relations préchargées
         """
-        updated = queryset.update(status='TO_DO')
-        self.message_user(request, f'{updated} issue(s) marquée(s) comme "À faire".')
-    mark_as_to_do.short_description = "Marquer comme 'À faire'"
+        return super().get_queryset(request).select_related(
+            'project', 'project__author', 'author', 'assignee'
+        )
 
-    def mark_as_in_progress(self, request, queryset):
+    def get_changelist_queryset(self, queryset):
         """
-        Action en lot pour marquer les issues sélectionnées comme 'En cours'.
+        OPTIMISATION: Diffère les descriptions, non affichées dans la liste.
 
         Args:
-            request: Requête HTTP de l'admin
-            queryset: Issues sélectionnées par l'utilisateur
+            queryset: QuerySet de la liste des issues
 
         Returns:
-            None: Affiche un message de confirmation via self.message_user
+            QuerySet: Issues sans les colonnes description (issue et projet)
         """
-        updated = queryset.update(status='IN_PROGRESS')
-        self.message_user(request, f'{updated} issue(s) marquée(s) comme "En cours".')
-    mark_as_in_progress.short_description = "Marquer comme 'En cours'"
+        return queryset.defer('description', 'project__description')
 
-    def mark_as_finished(self, request, queryset):
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """
-        Action en lot pour marquer les issues sélectionnées comme 'Terminé'.
+        OPTIMISATION: Ne charge que les colonnes utilisées pour les libellés.
 
         Args:
-            request: Requête HTTP de l'admin
-            queryset: Issues sélectionnées par l'utilisateur
+            db_field: Champ ForeignKey du modèle Issue
+            request: Requête HTTP courante
+            **kwargs: Arguments du champ de formulaire
 
         Returns:
-            None: Affiche un message de confirmation via self.message_user
+            ModelChoiceField: Champ de formulaire avec queryset allégé
         """
-        updated = queryset.update(status='FINISHED')
-        self.message_user(request, f'{updated} issue(s) marquée(s) comme "Terminé".')
-    mark_as_finished.short_description = "Marquer comme 'Terminé'"
+        if db_field.name == 'project':
+            kwargs['queryset'] = Project.objects.only('id', 'name')
+        elif db_field.name in ('author', 'assignee'):
+            kwargs['queryset'] = User.objects.only('id', 'username')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(LightChangeListMixin, admin.ModelAdmin):
     """
     Configuration de l'admin pour le modèle Comment.
 
@@ -280,9 +444,11 @@ class CommentAdmin(admin.ModelAdmin):
     )
 
     # Filtres disponibles dans la sidebar
+    # OPTIMISATION: pas de filtre 'author' (liste de tous les utilisateurs),
+    # la recherche sur author__username le remplace
     list_filter = (
         'issue__project', 'issue__tag', 'issue__status',
-        'created_time', 'author'
+        CreatedTimeRangeFilter
     )
 
     # Champs de recherche
@@ -307,9 +473,10 @@ class CommentAdmin(admin.ModelAdmin):
 
     # Champs en lecture seule
     readonly_fields = ('id', 'created_time')
+    # OPTIMISATION: Calculé une fois, issue et author figés après création
+    readonly_fields_on_change = readonly_fields + ('issue', 'author')
 
-    # Filtres par date
-    date_hierarchy = 'created_time'
+    # OPTIMISATION: Pas de date_hierarchy (voir CreatedTimeRangeFilter)
 
     # Tri par défaut
     ordering = ('-created_time',)
@@ -317,19 +484,86 @@ class CommentAdmin(admin.ModelAdmin):
     # Pagination
     list_per_page = 25
 
+    # OPTIMISATION: Pas de second COUNT sur toute la table ("X sur Y au total")
+    show_full_result_count = False
+
     # Autocomplete pour les relations
-    autocomplete_fields = ('issue', 'author')
+    autocomplete_fields = ('author',)
+
+    # OPTIMISATION: Saisie par ID pour l'issue (table volumineuse, pas de Select2)
+    raw_id_fields = ('issue',)
+
+    # OPTIMISATION: Jointure unique pour les colonnes de la liste (évite le N+1)
+    # issue__project est nécessaire pour __str__ de l'issue ("nom - projet")
+    list_select_related = ('issue', 'issue__project', 'author')
+
+    def get_queryset(self, request):
+        """
+        OPTIMISATION: Précharge les relations affichées (liste et formulaire).
+
+        Args:
+            request: Requête HTTP courante
+
+        Returns:
+            QuerySet: Commentaires avec relations préchargées
+        """
+        return super().get_queryset(request).select_related(
+            'issue', 'issue__project', 'author'
+        )
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """
+        OPTIMISATION: Précharge ce qu'affichent les libellés des relations.
+
+        Le libellé d'une issue ("nom - projet") nécessite son projet : il est
+        joint dans la même requête.
+
+        Args:
+            db_field: Champ ForeignKey du modèle Comment
+            request: Requête HTTP courante
+            **kwargs: Arguments du champ de formulaire
+
+        Returns:
+            ModelChoiceField: Champ de formulaire avec queryset optimisé
+        """
+        if db_field.name == 'issue':
+            kwargs['queryset'] = Issue.objects.select_related('project')
+        elif db_field.name == 'author':
+            kwargs['queryset'] = User.objects.only('id', 'username')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+    def get_changelist_queryset(self, queryset):
+        """
+        OPTIMISATION: Tronque la description côté base de données.
+
+        Seuls les 50 premiers caractères et la longueur transitent au lieu
+        du TextField complet pour chaque ligne de la liste.
+
+        Args:
+            queryset: QuerySet de la liste des commentaires
+
+        Returns:
+            QuerySet: Commentaires annotés avec _short et _len, description différée
+        """
+        return queryset.defer(
+            'description', 'issue__description', 'issue__project__description'
+        ).annotate(
+            _short=Substr('description', 1, 50),
+            _len=Length('description')
+        )
 
     def short_description(self, obj):
         """
         Affiche une version tronquée de la description du commentaire.
 
         Args:
-            obj (Comment): Instance du modèle Comment
+            obj (Comment): Instance du modèle Comment (annotée dans la liste)
 
         Returns:
             str: Description tronquée à 50 caractères avec "..." si nécessaire
         """
+        if hasattr(obj, '_short'):
+            return obj._short + "..." if obj._len > 50 else obj._short
         return obj.description[:50] + "..." if len(obj.description) > 50 else obj.description
     short_description.short_description = "Description"
 
@@ -348,5 +582,5 @@ class CommentAdmin(admin.ModelAdmin):
             tuple: Champs en lecture seule
         """
         if obj:  # En modification
-            return self.readonly_fields + ('issue', 'author')
+            return self.readonly_fields_on_change
         return self.readonly_fields
@@ -0,0 +1,21 @@
+"""
+Configuration de l'application API SoftDesk
+"""
+
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    """
+    Configuration de l'application api.
+
+    Enregistre les signaux au démarrage de Django.
+    """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'api'
+
+    def ready(self):
+        """
+        Importe les signaux pour connecter les receivers.
+        """
+        from . import signals  # noqa: F401
@@ -0,0 +1,142 @@
+"""
+Champs de modèle personnalisés pour l'API SoftDesk
+
+Ce module définit les champs Django spécifiques au projet, utilisés
+pour optimiser le stockage en base de données.
+"""
+
+from enum import Enum
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import models
+
+
+class ChoiceCodeField(models.Field):
+    """
+    Champ à choix stocké en base sous forme d'entier court.
+
+    OPTIMISATION: La colonne est un PositiveSmallIntegerField (2 octets)
+    au lieu d'un VARCHAR : lignes et index plus compacts, comparaisons
+    entières plus rapides que les comparaisons de chaînes.
+
+    Côté Python, la valeur reste la clé textuelle du choix ('TO_DO',
+    'backend', ...) : API, admin, filtres et serializers sont inchangés.
+    Le code stocké est fixé explicitement par le modèle (argument codes) :
+    réordonner ou ajouter des choix ne modifie pas les lignes existantes.
+    """
+    description = "Choix stocké sous forme d'entier court"
+
+    def __init__(self, *args, codes=None, **kwargs):
+        """
+        Initialise le champ et les tables de correspondance valeur/code.
+
+        Args:
+            *args: Arguments positionnels pour models.Field
+            codes (dict): Code entier stocké pour chaque clé de choix
+            **kwargs: Arguments nommés pour models.Field (choices requis)
+
+        Raises:
+            ImproperlyConfigured: Si codes ne couvre pas exactement les choix
+                ou contient des codes en double ou hors de 1..32767
+        """
+        super().__init__(*args, **kwargs)
+        # str() : membres de TextChoices ramenés à leur valeur textuelle
+        self._to_code = {str(value): code for value, code in (codes or {}).items()}
+        self._from_code = {code: value for value, code in self._to_code.items()}
+        choice_values = {str(value) for value, _ in self.choices or []}
+        if set(self._to_code) != choice_values:
+            raise ImproperlyConfigured(
+                f"ChoiceCodeField : codes doit définir un code pour chaque choix {sorted(choice_values)}"
+            )
+        if len(self._from_code) != len(self._to_code) or not all(
+            isinstance(code, int) and 1 <= code <= 32767 for code in self._from_code
+        ):
+            raise ImproperlyConfigured("ChoiceCodeField : les codes doivent être des entiers uniques de 1 à 32767")
+
+    def deconstruct(self):
+        """
+        Décrit le champ pour les migrations, codes compris.
+
+        Un changement de code apparaît ainsi dans makemigrations (AlterField)
+        et doit être accompagné d'une migration de données.
+
+        Returns:
+            tuple: (nom, chemin, args, kwargs) du champ
+        """
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['codes'] = dict(self._to_code)
+        return name, path, args, kwargs
+
+    def get_internal_type(self):
+        """
+        Type de colonne utilisé en base de données.
+
+        Returns:
+            str: 'PositiveSmallIntegerField'
+        """
+        return 'PositiveSmallIntegerField'
+
+    def get_prep_value(self, value):
+        """
+        Convertit la clé textuelle du choix en code entier pour la base.
+
+        Args:
+            value: Clé du choix, code entier ou None
+
+        Returns:
+            int or None: Code entier stocké en base
+
+        Raises:
+            ValueError: Si la valeur ne correspond à aucun choix
+        """
+        value = super().get_prep_value(value)
+        if value is None:
+            return value
+        if isinstance(value, int):
+            # Code entier : accepté uniquement s'il correspond à un choix
+            if value not in self._from_code:
+                raise ValueError(f"Code invalide pour '{self.name}' : {value!r}")
+            return value
+        if isinstance(value, Enum):
+            # Membre de TextChoices : utiliser sa valeur textuelle
+            value = value.value
+        try:
+            return self._to_code[value]
+        except KeyError:
+            raise ValueError(f"Choix invalide pour '{self.name}' : {value!r}")
+
+    def from_db_value(self, value, expression, connection):
+        """
+        Convertit le code entier lu en base en clé textuelle du choix.
+
+        Args:
+            value: Code entier lu en base
+            expression: Expression de la requête
+            connection: Connexion à la base de données
+
+        Returns:
+            str or None: Clé textuelle du choix
+        """
+        if value is None:
+            return value
+        return self._from_code.get(value, value)
+
+    def to_python(self, value):
+        """
+        Normalise une valeur (clé ou code entier) en clé textuelle.
+
+        Args:
+            value: Clé du choix, code entier ou None
+
+        Returns:
+            str or None: Clé textuelle du choix
+
+        Raises:
+            ValidationError: Si le code entier ne correspond à aucun choix
+        """
+        if isinstance(value, int):
+            try:
+                return self._from_code[value]
+            except KeyError:
+                raise ValidationError(f"Code invalide pour '{self.name}' : {value!r}", code='invalid_choice')
+        return value
@@ -0,0 +1,37 @@
+"""
+Middlewares personnalisés pour l'API SoftDesk
+
+Ce module définit les middlewares appliqués aux réponses HTTP du projet.
+"""
+
+from django.middleware.gzip import GZipMiddleware
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    Compression gzip des réponses, sauf pour les endpoints d'authentification.
+
+    OPTIMISATION: Les listes JSON, très répétitives, sont fortement réduites
+    par gzip : moins d'octets transférés et un temps de réception plus court.
+
+    SECURITY: Les réponses qui contiennent des jetons JWT (inscription,
+    connexion, rafraîchissement) ne sont pas compressées, pour ne pas exposer
+    ces secrets à une attaque par compression de type BREACH.
+    """
+    # Préfixes des chemins dont les réponses ne sont jamais compressées
+    excluded_prefixes = ('/api/auth/',)
+
+    def process_response(self, request, response):
+        """
+        Compresse la réponse si son chemin n'est pas exclu.
+
+        Args:
+            request: La requête HTTP
+            response: La réponse HTTP à compresser
+
+        Returns:
+            HttpResponse: La réponse, compressée ou non
+        """
+        if request.path.startswith(self.excluded_prefixes):
+            return response
+        return super().process_response(request, response)
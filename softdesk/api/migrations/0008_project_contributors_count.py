@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_contributors_count(apps, schema_editor):
+    """Initialise le compteur dénormalisé à partir des contributeurs existants."""
+    Project = apps.get_model('api', 'Project')
+    Contributor = apps.get_model('api', 'Contributor')
+    counts = Contributor.objects.filter(
+        project=OuterRef('pk')
+    ).order_by().values('project').annotate(total=Count('pk')).values('total')
+    Project.objects.update(contributors_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_make_date_of_birth_optional_for_superuser'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='contributors_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, verbose_name='Contributeurs'),
+        ),
+        migrations.RunPython(backfill_contributors_count, migrations.RunPython.noop),
+    ]
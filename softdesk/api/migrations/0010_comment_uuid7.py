@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:21
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='id',
+            field=models.UUIDField(default=api.models.uuid7, editable=False, primary_key=True, serialize=False, verbose_name='Identifiant unique'),
+        ),
+    ]
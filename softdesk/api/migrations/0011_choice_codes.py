@@ -0,0 +1,63 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:25
+
+import api.fields
+from django.db import migrations
+
+# Correspondance clé -> code figée à cette migration (argument codes de ChoiceCodeField).
+# Utilisée à la fois par la conversion des données et par les AlterField ci-dessous.
+CHOICE_CODES = {
+    ('project', 'type'): {'backend': 1, 'frontend': 2, 'ios': 3, 'android': 4},
+    ('issue', 'priority'): {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3},
+    ('issue', 'tag'): {'BUG': 1, 'FEATURE': 2, 'TASK': 3},
+    ('issue', 'status'): {'TO_DO': 1, 'IN_PROGRESS': 2, 'FINISHED': 3},
+}
+
+
+def _convert(apps, to_codes):
+    """Réécrit les colonnes texte avec les codes (ou l'inverse), une requête UPDATE par choix."""
+    for (model_name, field_name), codes in CHOICE_CODES.items():
+        Model = apps.get_model('api', model_name)
+        for value, code in codes.items():
+            old, new = (value, str(code)) if to_codes else (str(code), value)
+            Model.objects.filter(**{field_name: old}).update(**{field_name: new})
+
+
+def strings_to_codes(apps, schema_editor):
+    """Remplace les clés textuelles par leur code avant le changement de type."""
+    _convert(apps, to_codes=True)
+
+
+def codes_to_strings(apps, schema_editor):
+    """Restaure les clés textuelles après retour au type VARCHAR."""
+    _convert(apps, to_codes=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_comment_uuid7'),
+    ]
+
+    operations = [
+        migrations.RunPython(strings_to_codes, codes_to_strings),
+        migrations.AlterField(
+            model_name='issue',
+            name='priority',
+            field=api.fields.ChoiceCodeField(choices=[('LOW', 'Faible'), ('MEDIUM', 'Moyenne'), ('HIGH', 'Élevée')], codes=CHOICE_CODES['issue', 'priority'], default='MEDIUM', verbose_name='Priorité'),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='status',
+            field=api.fields.ChoiceCodeField(choices=[('TO_DO', 'À faire'), ('IN_PROGRESS', 'En cours'), ('FINISHED', 'Terminé')], codes=CHOICE_CODES['issue', 'status'], default='TO_DO', verbose_name='Statut'),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='tag',
+            field=api.fields.ChoiceCodeField(choices=[('BUG', 'Bug'), ('FEATURE', 'Fonctionnalité'), ('TASK', 'Tâche')], codes=CHOICE_CODES['issue', 'tag'], default='TASK', verbose_name='Type'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='type',
+            field=api.fields.ChoiceCodeField(choices=[('backend', 'Back-end'), ('frontend', 'Front-end'), ('ios', 'iOS'), ('android', 'Android')], codes=CHOICE_CODES['project', 'type'], verbose_name='Type'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_choice_codes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'status'], name='issue_proj_status_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_comment_project(apps, schema_editor):
+    """Renseigne le projet dénormalisé des commentaires existants à partir de leur issue."""
+    Comment = apps.get_model('api', 'Comment')
+    Issue = apps.get_model('api', 'Issue')
+    Comment.objects.update(
+        project_id=Subquery(Issue.objects.filter(pk=OuterRef('issue_id')).values('project_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_issue_project_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='project',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.project', verbose_name='Projet'),
+        ),
+        migrations.RunPython(backfill_comment_project, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='comment',
+            name='project',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.project', verbose_name='Projet'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_comment_project'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='contributor',
+            constraint=models.UniqueConstraint(fields=('user', 'project'), name='uniq_contributor'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='contributor',
+            unique_together=set(),
+        ),
+    ]
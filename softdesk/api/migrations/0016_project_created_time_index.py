@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-16 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_contributor_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_time'], name='project_ct_idx'),
+        ),
+    ]
@@ -7,11 +7,35 @@ de projets collaboratifs avec système de tickets et commentaires.
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from datetime import date
+from django.utils.functional import cached_property
+from .fields import ChoiceCodeField
+import os
+import time
 import uuid
 
 
+def uuid7():
+    """
+    Génère un UUID version 7 (RFC 9562), ordonné dans le temps.
+
+    Les 48 premiers bits contiennent le timestamp Unix en millisecondes,
+    le reste est aléatoire. Les nouvelles clés s'insèrent ainsi en fin
+    d'index B-tree au lieu de pages aléatoires (contrairement à uuid4).
+
+    Returns:
+        uuid.UUID: Un UUID v7
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # Version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # Variante RFC 9562
+    return uuid.UUID(int=value)
+
+
 class User(AbstractUser):
     """
     Modèle User personnalisé avec conformité RGPD.
@@ -54,20 +78,20 @@ class User(AbstractUser):
             ValidationError: Si l'utilisateur a moins de 15 ans
         """
         super().clean()
-        if self.date_of_birth:
-            today = date.today()
-            age = today.year - self.date_of_birth.year - (
-                (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
+        # Recalcul explicite : la date de naissance a pu changer depuis la mise en cache de age
+        age = self._compute_age()
+        if age is not None and age < 15:
+            raise ValidationError(
+                "L'utilisateur doit avoir au moins 15 ans selon les normes RGPD."
             )
-            if age < 15:
-                raise ValidationError(
-                    "L'utilisateur doit avoir au moins 15 ans selon les normes RGPD."
-                )
 
     def save(self, *args, **kwargs):
         """
         Sauvegarde avec validation automatique de l'âge.
 
+        OPTIMISATION: La validation est ignorée pour les sauvegardes partielles
+        qui ne touchent pas date_of_birth (ex: update_last_login à chaque connexion).
+
         Args:
             *args: Arguments positionnels pour la méthode save parente
             **kwargs: Arguments nommés pour la méthode save parente
@@ -75,13 +99,14 @@ class User(AbstractUser):
         Raises:
             ValidationError: Si la validation clean() échoue
         """
-        self.clean()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'date_of_birth' in update_fields:
+            self.clean()
         super().save(*args, **kwargs)
 
-    @property
-    def age(self):
+    def _compute_age(self):
         """
-        Calcule l'âge actuel de l'utilisateur.
+        Calcule l'âge à partir de la date de naissance courante.
 
         Returns:
             int or None: L'âge en années ou None si pas de date de naissance
@@ -89,12 +114,26 @@ class User(AbstractUser):
         Note:
             Prend en compte les mois et jours pour un calcul précis
         """
-        if self.date_of_birth:
-            today = date.today()
-            return today.year - self.date_of_birth.year - (
-                (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
-            )
-        return None
+        birth = self.date_of_birth
+        if birth is None:
+            return None
+        today = date.today()
+        # Dates encodées en entiers AAAAMMJJ : la division entière donne l'âge révolu
+        return ((today.year * 10000 + today.month * 100 + today.day)
+                - (birth.year * 10000 + birth.month * 100 + birth.day)) // 10000
+
+    @cached_property
+    def age(self):
+        """
+        Âge actuel de l'utilisateur.
+
+        OPTIMISATION: Calculé une seule fois par instance (cached_property),
+        les listes (admin, serializers) n'appellent date.today() qu'une fois par ligne.
+
+        Returns:
+            int or None: L'âge en années ou None si pas de date de naissance
+        """
+        return self._compute_age()
 
     def __str__(self):
         """
@@ -118,16 +157,20 @@ class Project(models.Model):
     Représente un projet de développement avec contributeurs,
     issues et système de commentaires.
     """
-    TYPE_CHOICES = [
-        ('backend', 'Back-end'),
-        ('frontend', 'Front-end'),
-        ('ios', 'iOS'),
-        ('android', 'Android'),
-    ]
+    class Type(models.TextChoices):
+        BACKEND = 'backend', 'Back-end'
+        FRONTEND = 'frontend', 'Front-end'
+        IOS = 'ios', 'iOS'
+        ANDROID = 'android', 'Android'
+
+    TYPE_CHOICES = Type.choices
+    # Codes stockés en base (voir ChoiceCodeField) : ne jamais modifier un code existant
+    TYPE_CODES = {Type.BACKEND: 1, Type.FRONTEND: 2, Type.IOS: 3, Type.ANDROID: 4}
 
     name = models.CharField(max_length=255, verbose_name="Nom du projet")
     description = models.TextField(verbose_name="Description")
-    type = models.CharField(max_length=20, choices=TYPE_CHOICES, verbose_name="Type")
+    # OPTIMISATION: Stocké en entier court (voir ChoiceCodeField)
+    type = ChoiceCodeField(choices=TYPE_CHOICES, codes=TYPE_CODES, verbose_name="Type")
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -136,6 +179,60 @@ class Project(models.Model):
     )
     created_time = models.DateTimeField(auto_now_add=True, verbose_name="Date de création")
 
+    # OPTIMISATION: Compteur dénormalisé, maintenu par les signaux de Contributor
+    # (jamais écrit par save(), voir Project.save)
+    contributors_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name="Contributeurs"
+    )
+
+    # Cache des ids de contributeurs (voir contributor_user_ids)
+    _contrib_ids = None
+
+    def contributor_user_ids(self):
+        """
+        Retourne les ids des utilisateurs contributeurs du projet.
+
+        OPTIMISATION: Chargés en une requête puis mémorisés sur l'instance ;
+        les vérifications d'appartenance suivantes sur ce projet sont des
+        recherches en mémoire. Le cache est invalidé par les signaux de
+        Contributor pour l'instance de projet liée.
+
+        Returns:
+            frozenset: Ids des utilisateurs contributeurs
+        """
+        if self._contrib_ids is None:
+            self._contrib_ids = frozenset(
+                Contributor.objects.filter(project_id=self.pk).values_list('user_id', flat=True)
+            )
+        return self._contrib_ids
+
+    def save(self, *args, **kwargs):
+        """
+        Sauvegarde sans jamais réécrire le compteur de contributeurs.
+
+        contributors_count n'est modifié que par des UPDATE atomiques
+        (signaux de Contributor, bulk_add) : une sauvegarde complète depuis
+        une instance périmée (admin, serializer, ...) réécrirait l'ancienne
+        valeur. Pour un projet existant, le compteur est donc retiré des
+        champs mis à jour ; à la création, sa valeur initiale est insérée.
+
+        Args:
+            *args: Arguments positionnels pour la méthode save parente
+            **kwargs: Arguments nommés pour la méthode save parente
+        """
+        if not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                # Comme Django : seuls les champs chargés sont écrits
+                update_fields = {
+                    field.attname for field in self._meta.concrete_fields if not field.primary_key
+                }.difference(self.get_deferred_fields())
+            kwargs['update_fields'] = [name for name in update_fields if name != 'contributors_count']
+        super().save(*args, **kwargs)
+
     def __str__(self):
         """
         Représentation textuelle du projet.
@@ -149,6 +246,10 @@ class Project(models.Model):
         verbose_name = "Projet"
         verbose_name_plural = "Projets"
         ordering = ['-created_time']
+        indexes = [
+            # OPTIMISATION: Pagination par curseur sur la date de création
+            models.Index(fields=['-created_time'], name='project_ct_idx'),
+        ]
 
 
 class Contributor(models.Model):
@@ -175,8 +276,15 @@ class Contributor(models.Model):
     class Meta:
         verbose_name = "Contributeur"
         verbose_name_plural = "Contributeurs"
-        unique_together = ('user', 'project')  # Un utilisateur ne peut être contributeur qu'une fois par projet
+        constraints = [
+            # Un utilisateur ne peut être contributeur qu'une fois par projet
+            models.UniqueConstraint(fields=['user', 'project'], name='uniq_contributor'),
+        ]
         ordering = ['-created_time']
+        indexes = [
+            # OPTIMISATION: Liste des contributeurs d'un projet triée par date
+            models.Index(fields=['project', '-created_time'], name='contributor_proj_ct_idx'),
+        ]
 
     def __str__(self):
         """
@@ -187,6 +295,61 @@ class Contributor(models.Model):
         """
         return f"{self.user.username} - {self.project.name}"
 
+    @classmethod
+    def bulk_add(cls, project, users):
+        """
+        Ajoute un lot d'utilisateurs comme contributeurs d'un projet.
+
+        OPTIMISATION: INSERT groupés (par lots de 500) qui ignorent les
+        doublons en base (ON CONFLICT DO NOTHING), au lieu d'un INSERT et
+        d'une vérification d'unicité par contributeur.
+
+        bulk_create n'émettant pas post_save, le compteur dénormalisé du
+        projet est resynchronisé en une seule requête UPDATE.
+
+        Args:
+            project (Project): Le projet cible
+            users (iterable): Utilisateurs à ajouter (déjà contributeurs ignorés)
+
+        Returns:
+            list: Les contributeurs construits (clés non renseignées)
+        """
+        unique_users = {user.pk: user for user in users}.values()
+        contributors = cls.objects.bulk_create(
+            [cls(user=user, project=project) for user in unique_users],
+            batch_size=500,
+            ignore_conflicts=True
+        )
+        total = cls.objects.filter(
+            project=OuterRef('pk')
+        ).order_by().values('project').annotate(total=Count('pk')).values('total')
+        Project.objects.filter(pk=project.pk).update(contributors_count=Coalesce(Subquery(total), 0))
+        project._contrib_ids = None
+        return contributors
+
+
+def _check_memberships(pairs, message):
+    """
+    Vérifie en une requête qu'un ensemble de couples (projet, utilisateur) sont contributeurs.
+
+    Args:
+        pairs (set): Couples (project_id, user_id) à vérifier
+        message (str): Message d'erreur si un couple n'est pas contributeur
+
+    Raises:
+        ValidationError: Si un utilisateur n'est pas contributeur du projet
+    """
+    if not pairs:
+        return
+    membership = set(
+        Contributor.objects.filter(
+            project_id__in={project_id for project_id, _ in pairs},
+            user_id__in={user_id for _, user_id in pairs},
+        ).values_list('project_id', 'user_id')
+    )
+    if not pairs <= membership:
+        raise ValidationError(message)
+
 
 class Issue(models.Model):
     """
@@ -197,25 +360,31 @@ class Issue(models.Model):
     """
 
     # Choix pour la priorité
-    PRIORITY_CHOICES = [
-        ('LOW', 'Faible'),
-        ('MEDIUM', 'Moyenne'),
-        ('HIGH', 'Élevée'),
-    ]
+    class Priority(models.TextChoices):
+        LOW = 'LOW', 'Faible'
+        MEDIUM = 'MEDIUM', 'Moyenne'
+        HIGH = 'HIGH', 'Élevée'
 
     # Choix pour les balises/types
-    TAG_CHOICES = [
-        ('BUG', 'Bug'),
-        ('FEATURE', 'Fonctionnalité'),
-        ('TASK', 'Tâche'),
-    ]
+    class Tag(models.TextChoices):
+        BUG = 'BUG', 'Bug'
+        FEATURE = 'FEATURE', 'Fonctionnalité'
+        TASK = 'TASK', 'Tâche'
 
     # Choix pour le statut
-    STATUS_CHOICES = [
-        ('TO_DO', 'À faire'),
-        ('IN_PROGRESS', 'En cours'),
-        ('FINISHED', 'Terminé'),
-    ]
+    class Status(models.TextChoices):
+        TO_DO = 'TO_DO', 'À faire'
+        IN_PROGRESS = 'IN_PROGRESS', 'En cours'
+        FINISHED = 'FINISHED', 'Terminé'
+
+    PRIORITY_CHOICES = Priority.choices
+    TAG_CHOICES = Tag.choices
+    STATUS_CHOICES = Status.choices
+
+    # Codes stockés en base (voir ChoiceCodeField) : ne jamais modifier un code existant
+    PRIORITY_CODES = {Priority.LOW: 1, Priority.MEDIUM: 2, Priority.HIGH: 3}
+    TAG_CODES = {Tag.BUG: 1, Tag.FEATURE: 2, Tag.TASK: 3}
+    STATUS_CODES = {Status.TO_DO: 1, Status.IN_PROGRESS: 2, Status.FINISHED: 3}
 
     # Champs obligatoires
     name = models.CharField(max_length=255, verbose_name="Nom de l'issue")
@@ -247,27 +416,28 @@ class Issue(models.Model):
         verbose_name="Assigné à"
     )
 
+    # OPTIMISATION: priority, tag et status sont stockés en entiers courts (voir ChoiceCodeField)
     # Priorité de l'issue
-    priority = models.CharField(
-        max_length=10,
+    priority = ChoiceCodeField(
         choices=PRIORITY_CHOICES,
-        default='MEDIUM',
+        codes=PRIORITY_CODES,
+        default=Priority.MEDIUM,
         verbose_name="Priorité"
     )
 
     # Balise/Type de l'issue
-    tag = models.CharField(
-        max_length=10,
+    tag = ChoiceCodeField(
         choices=TAG_CHOICES,
-        default='TASK',
+        codes=TAG_CODES,
+        default=Tag.TASK,
         verbose_name="Type"
     )
 
     # Statut de progression
-    status = models.CharField(
-        max_length=15,
+    status = ChoiceCodeField(
         choices=STATUS_CHOICES,
-        default='TO_DO',
+        codes=STATUS_CODES,
+        default=Status.TO_DO,
         verbose_name="Statut"
     )
 
@@ -279,6 +449,68 @@ class Issue(models.Model):
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         ordering = ['-created_time']
+        indexes = [
+            # OPTIMISATION: Index composites alignés sur les filtres et le tri par date
+            models.Index(fields=['project', '-created_time'], name='issue_proj_ct_idx'),
+            models.Index(fields=['project', 'status'], name='issue_proj_status_idx'),
+            models.Index(fields=['status', '-created_time'], name='issue_status_ct_idx'),
+            models.Index(fields=['assignee', 'status'], name='issue_assignee_status_idx'),
+        ]
+
+    @classmethod
+    def bulk_validate_and_create(cls, issues):
+        """
+        Valide puis crée un lot d'issues.
+
+        OPTIMISATION: Une requête pour vérifier toutes les assignations et un
+        INSERT groupé, au lieu d'une requête de validation et d'un INSERT par issue.
+
+        Args:
+            issues (list): Instances d'Issue non sauvegardées
+
+        Returns:
+            list: Les issues créées
+
+        Raises:
+            ValidationError: Si un assigné n'est pas contributeur du projet
+        """
+        _check_memberships(
+            {(issue.project_id, issue.assignee_id) for issue in issues if issue.assignee_id},
+            "L'utilisateur assigné doit être contributeur du projet."
+        )
+        return cls.objects.bulk_create(issues)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Mémorise le projet chargé pour détecter un changement de projet.
+
+        Args:
+            db: Alias de la base de données
+            field_names: Noms des champs chargés
+            values: Valeurs des champs chargés
+
+        Returns:
+            Issue: L'instance chargée depuis la base
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_project_id = instance.__dict__.get('project_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Sauvegarde en répercutant un changement de projet sur les commentaires.
+
+        Args:
+            *args: Arguments positionnels pour la méthode save parente
+            **kwargs: Arguments nommés pour la méthode save parente
+        """
+        loaded_project_id = getattr(self, '_loaded_project_id', None)
+        super().save(*args, **kwargs)
+        if loaded_project_id is not None and loaded_project_id != self.project_id:
+            # Garder Comment.project (dénormalisé) cohérent avec l'issue
+            Comment.objects.filter(issue_id=self.pk).update(project_id=self.project_id)
+        self._loaded_project_id = self.project_id
 
     def __str__(self):
         """
@@ -293,12 +525,18 @@ class Issue(models.Model):
         """
         Valide que l'assigné est contributeur du projet.
 
+        OPTIMISATION: Vérification en mémoire, sur self._project_contrib_ids
+        si l'appelant l'a renseigné (lot), sinon sur les ids mémorisés du projet.
+
         Raises:
             ValidationError: Si l'assigné n'est pas contributeur du projet
         """
         super().clean()
-        if self.assignee and self.project:
-            if not self.project.contributors.filter(user=self.assignee).exists():
+        if self.assignee_id and self.project_id:
+            contrib_ids = getattr(self, '_project_contrib_ids', None)
+            if contrib_ids is None:
+                contrib_ids = self.project.contributor_user_ids()
+            if self.assignee_id not in contrib_ids:
                 raise ValidationError(
                     "L'utilisateur assigné doit être contributeur du projet."
                 )
@@ -313,9 +551,10 @@ class Comment(models.Model):
     """
 
     # Identifiant unique UUID pour référencer le commentaire
+    # OPTIMISATION: UUID v7 ordonné dans le temps pour la localité de l'index
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="Identifiant unique"
     )
@@ -341,6 +580,16 @@ class Comment(models.Model):
         verbose_name="Auteur"
     )
 
+    # OPTIMISATION: Projet dénormalisé (toujours égal à issue.project), évite
+    # de charger l'issue pour les vérifications d'appartenance
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='+',
+        editable=False,
+        verbose_name="Projet"
+    )
+
     # Horodatage
     created_time = models.DateTimeField(
         auto_now_add=True,
@@ -351,6 +600,10 @@ class Comment(models.Model):
         verbose_name = "Commentaire"
         verbose_name_plural = "Commentaires"
         ordering = ['-created_time']
+        indexes = [
+            # OPTIMISATION: Commentaires d'une issue triés par date
+            models.Index(fields=['issue', '-created_time'], name='comment_issue_ct_idx'),
+        ]
 
     def __str__(self):
         """
@@ -365,12 +618,58 @@ class Comment(models.Model):
         """
         Valide que l'auteur est contributeur du projet de l'issue.
 
+        OPTIMISATION: Vérification en mémoire, sur self._project_contrib_ids
+        si l'appelant l'a renseigné (lot), sinon sur les ids mémorisés du projet.
+
         Raises:
             ValidationError: Si l'auteur n'est pas contributeur du projet
         """
         super().clean()
-        if self.author and self.issue and self.issue.project:
-            if not self.issue.project.contributors.filter(user=self.author).exists():
+        if self.author_id and self.issue_id:
+            contrib_ids = getattr(self, '_project_contrib_ids', None)
+            if contrib_ids is None:
+                project = self.project if self.project_id else self.issue.project
+                contrib_ids = project.contributor_user_ids()
+            if self.author_id not in contrib_ids:
                 raise ValidationError(
                     "L'auteur du commentaire doit être contributeur du projet."
                 )
+
+    @classmethod
+    def bulk_validate_and_create(cls, comments):
+        """
+        Valide puis crée un lot de commentaires.
+
+        OPTIMISATION: Une requête pour vérifier tous les auteurs et un INSERT
+        groupé, au lieu d'une requête de validation et d'un INSERT par commentaire.
+
+        Args:
+            comments (list): Instances de Comment non sauvegardées
+
+        Returns:
+            list: Les commentaires créés
+
+        Raises:
+            ValidationError: Si un auteur n'est pas contributeur du projet
+        """
+        for comment in comments:
+            # bulk_create n'appelle pas save() : renseigner le projet dénormalisé
+            if comment.project_id is None:
+                comment.project_id = comment.issue.project_id
+        _check_memberships(
+            {(comment.project_id, comment.author_id) for comment in comments},
+            "L'auteur du commentaire doit être contributeur du projet."
+        )
+        return cls.objects.bulk_create(comments)
+
+    def save(self, *args, **kwargs):
+        """
+        Sauvegarde en renseignant le projet dénormalisé à partir de l'issue.
+
+        Args:
+            *args: Arguments positionnels pour la méthode save parente
+            **kwargs: Arguments nommés pour la méthode save parente
+        """
+        if self.project_id is None:
+            self.project_id = self.issue.project_id
+        super().save(*args, **kwargs)
@@ -0,0 +1,21 @@
+"""
+Pagination de l'API SoftDesk
+
+Ce module définit la pagination appliquée aux listes de l'API.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedTimeCursorPagination(CursorPagination):
+    """
+    Pagination par curseur, des éléments les plus récents aux plus anciens.
+
+    OPTIMISATION: Chaque page est lue par une recherche sur created_time
+    (WHERE created_time < curseur, via les index *_ct_idx) au lieu d'un
+    OFFSET, et sans requête COUNT(*) : le coût d'une page ne dépend plus
+    du nombre total de lignes ni de la profondeur de la page.
+
+    La taille de page est celle de REST_FRAMEWORK['PAGE_SIZE'].
+    """
+    ordering = '-created_time'
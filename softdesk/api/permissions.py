@@ -5,10 +5,75 @@ Ce module définit les permissions personnalisées pour contrôler l'accès
 aux ressources selon les rôles et statuts des utilisateurs.
 """
 
+from django.db.models import Exists, OuterRef
 from rest_framework import permissions
 
+from .models import Contributor, Project
 
-class IsContributor(permissions.BasePermission):
+
+def contributor_project_ids(request):
+    """
+    Retourne les ids des projets dont l'utilisateur connecté est contributeur.
+
+    OPTIMISATION: Une seule requête par requête HTTP, le résultat est mis en
+    cache sur l'objet request et partagé entre les vérifications des vues
+    (get_project) et des permissions (has_object_permission).
+
+    Args:
+        request: La requête HTTP contenant l'utilisateur authentifié
+
+    Returns:
+        set: Ids des projets de l'utilisateur
+    """
+    project_ids = getattr(request, '_contributor_project_ids', None)
+    if project_ids is None:
+        project_ids = set(
+            Contributor.objects.filter(user=request.user).values_list('project_id', flat=True)
+        )
+        request._contributor_project_ids = project_ids
+    return project_ids
+
+
+def projects_with_membership(request):
+    """
+    Projets annotés avec l'appartenance (is_member) de l'utilisateur connecté.
+
+    OPTIMISATION: L'appartenance est calculée par un EXISTS dans la même
+    requête que le projet, sans requête séparée sur les contributeurs.
+
+    Args:
+        request: La requête HTTP contenant l'utilisateur authentifié
+
+    Returns:
+        QuerySet: Projets annotés avec is_member
+    """
+    return Project.objects.annotate(
+        is_member=Exists(Contributor.objects.filter(project=OuterRef('pk'), user=request.user))
+    )
+
+
+class StatelessPermission(permissions.BasePermission):
+    """
+    Base des permissions sans état : une seule instance partagée par classe.
+
+    OPTIMISATION: DRF instancie les permissions à chaque requête ; ces classes
+    n'ayant aucun attribut d'instance, la même instance est réutilisée.
+    """
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """
+        Retourne l'instance unique de la classe, créée au premier appel.
+
+        Returns:
+            StatelessPermission: L'instance partagée
+        """
+        if cls.__dict__.get('_instance') is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
+class IsContributor(StatelessPermission):
     """SECURITY: Permission - seuls les contributeurs du projet peuvent accéder"""
 
     def has_object_permission(self, request, view, obj):
@@ -26,20 +91,30 @@ class IsContributor(permissions.BasePermission):
         Returns:
             bool: True si l'utilisateur est contributeur du projet, False sinon
         """
-        # Gérer les différents types d'objets
-        if hasattr(obj, 'project'):
-            # Pour les Issues : obj.project
-            project = obj.project
-        elif hasattr(obj, 'issue'):
-            # Pour les Comments : obj.issue.project
-            project = obj.issue.project
-        else:
+        # OPTIMISATION: Appartenance déjà annotée par le queryset (ProjectViewSet)
+        is_member = getattr(obj, 'is_member', None)
+        if is_member is not None:
+            return is_member
+
+        # Gérer les différents types d'objets (ids uniquement, sans requête)
+        if isinstance(obj, Project):
             # Pour les Projects : obj lui-même
-            project = obj
-        return project.contributors.filter(user=request.user).exists()
+            # OPTIMISATION: L'auteur est toujours contributeur (ne peut pas être retiré)
+            if obj.author_id == request.user.id:
+                return True
+            project_id = obj.pk
+        else:
+            # Pour les Issues, Contributors et Comments (projet dénormalisé) : obj.project_id
+            project_id = obj.project_id
+        # OPTIMISATION: Appartenance déjà annotée sur le projet chargé par la vue
+        # (get_project / get_issue des vues imbriquées)
+        project = getattr(view, 'project', None)
+        if project is not None and project.pk == project_id:
+            return project.is_member
+        return project_id in contributor_project_ids(request)
 
 
-class IsAuthorOrReadOnly(permissions.BasePermission):
+class IsAuthorOrReadOnly(StatelessPermission):
     """SECURITY: Permission - seul l'auteur peut modifier, lecture pour les autres"""
 
     def has_object_permission(self, request, view, obj):
@@ -63,4 +138,5 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
         """
         if request.method in permissions.SAFE_METHODS:
             return True
-        return obj.author == request.user
+        # OPTIMISATION: Comparaison des ids, sans charger l'auteur (obj.author)
+        return getattr(obj, 'author_id', None) == request.user.id
@@ -0,0 +1,44 @@
+"""
+Renderers personnalisés pour l'API SoftDesk
+
+Ce module définit le rendu JSON des réponses de l'API.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Rendu JSON des réponses avec orjson.
+
+    OPTIMISATION: orjson (extension C) encode dictionnaires, listes, dates
+    et UUID bien plus vite que json.dumps. La sortie est identique à celle
+    de JSONRenderer : JSON compact en UTF-8, dates UTC suffixées par 'Z'.
+    Les types non gérés nativement (chaînes traduites paresseuses, Decimal,
+    QuerySet, ...) sont délégués à l'encodeur de DRF.
+    """
+    # Encodeur DRF utilisé pour les types inconnus d'orjson
+    _default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Encode les données de la réponse en JSON.
+
+        Args:
+            data: Données à encoder
+            accepted_media_type (str): Type de média négocié (peut demander une indentation)
+            renderer_context (dict): Contexte de rendu fourni par la vue
+
+        Returns:
+            bytes: Corps de la réponse encodé en UTF-8
+        """
+        if data is None:
+            return b''
+
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        # API navigable ou en-tête Accept avec indent : sortie lisible
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self._default, option=option)
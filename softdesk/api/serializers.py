@@ -3,12 +3,64 @@ Serializers pour l'API SoftDesk
 Gère la conversion entre les objets Python/Django et les formats JSON pour l'API REST
 """
 
+import copy
+
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from .models import User, Project, Contributor, Issue, Comment
+from .permissions import contributor_project_ids
+
+
+def get_user_by_username(username):
+    """
+    Récupère un utilisateur par son username.
+
+    OPTIMISATION: Ne charge que les colonnes utilisées par les serializers
+    (id pour les clés étrangères, username pour l'affichage).
+
+    Args:
+        username (str): Le nom d'utilisateur recherché
+
+    Returns:
+        User: L'utilisateur trouvé (colonnes id et username)
+
+    Raises:
+        User.DoesNotExist: Si aucun utilisateur ne porte ce username
+    """
+    return User.objects.only('id', 'username').get(username=username)
 
 
-class UserSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Mémorise au niveau de la classe les champs construits par get_fields().
+
+    OPTIMISATION: DRF refait l'introspection du modèle (build_field pour
+    chaque champ de Meta.fields) à chaque instanciation du serializer.
+    Les champs sont ici construits une seule fois par classe, puis copiés
+    en profondeur pour chaque instance, comme DRF le fait pour les champs
+    déclarés : validateurs, choix, querysets et serializers imbriqués ne
+    sont jamais partagés entre instances ni entre requêtes.
+    """
+
+    def get_fields(self):
+        """
+        Retourne une copie profonde des champs mémorisés pour la classe.
+
+        Returns:
+            dict: Champs du serializer, propres à cette instance
+        """
+        cls = type(self)
+        # __dict__ : chaque sous-classe a son propre cache
+        template = cls.__dict__.get('_field_templates')
+        if template is None:
+            template = super().get_fields()
+            cls._field_templates = template
+        return copy.deepcopy(template)
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer pour le modèle User personnalisé
     - Gère l'inscription et l'affichage des utilisateurs
@@ -51,8 +103,8 @@ class UserSerializer(serializers.ModelSerializer):
         """
         Création d'un nouvel utilisateur.
         - Extrait le mot de passe des données
-        - Utilise create_user() pour le hash automatique du mot de passe
-        - Respecte les validations RGPD (âge minimum 15 ans)
+        - Normalise username/email et hashe le mot de passe comme create_user()
+        - Respecte les validations RGPD (âge minimum 15 ans, via User.save())
 
         Args:
             validated_data (dict): Les données validées du serializer
@@ -67,10 +119,15 @@ class UserSerializer(serializers.ModelSerializer):
 
         password = validated_data.pop('password')  # Retire le mot de passe des données
 
+        # OPTIMISATION: Un seul INSERT (create_user() sauvegardait avant le set_password()
+        # qui imposait une seconde sauvegarde)
+        validated_data['username'] = User.normalize_username(validated_data['username'])
+        validated_data['email'] = User.objects.normalize_email(validated_data.get('email', ''))
+        user = User(**validated_data)
+        user.set_password(password)  # Hash le mot de passe
+
         try:
-            user = User.objects.create_user(**validated_data)  # Crée l'utilisateur
-            user.set_password(password)  # Hash le mot de passe
-            user.save()
+            user.save(force_insert=True)
             return user
         except ValidationError as e:
             # Transformer les erreurs du modèle en erreurs de serializer
@@ -79,7 +136,7 @@ class UserSerializer(serializers.ModelSerializer):
     # Validation d'âge gérée dans le modèle User.clean() - pas de duplication
 
 
-class LoginSerializer(serializers.Serializer):
+class LoginSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer pour l'authentification des utilisateurs
     - Valide les identifiants (username + password)
@@ -122,41 +179,118 @@ class LoginSerializer(serializers.Serializer):
         return data
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+def requested_fields(request):
+    """
+    Champs demandés par le client via le paramètre de requête 'fields' (GET).
+
+    Args:
+        request: La requête HTTP, ou None
+
+    Returns:
+        set or None: Noms des champs demandés, None si tous les champs sont attendus
+    """
+    # Lecture seule : les écritures valident toujours l'ensemble des champs
+    if request is None or request.method != 'GET':
+        return None
+    requested = request.query_params.get('fields')
+    if not requested:
+        return None
+    return {name.strip() for name in requested.split(',')}
+
+
+class SparseFieldsetsMixin:
+    """
+    Permet au client de limiter les champs renvoyés via ?fields=id,name.
+
+    OPTIMISATION: Les champs exclus ne sont ni calculés ni sérialisés,
+    ce qui allège la réponse des listes volumineuses.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Retire les champs non demandés par le paramètre de requête 'fields' (GET).
+
+        Args:
+            *args: Arguments positionnels du serializer parent
+            **kwargs: Arguments nommés du serializer parent
+        """
+        super().__init__(*args, **kwargs)
+        keep = requested_fields(self.context.get('request'))
+        if keep:
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
+
+
+class ChoiceDisplayField(serializers.ReadOnlyField):
+    """
+    Libellé lisible d'un champ à choix, résolu dans un dictionnaire précalculé.
+
+    OPTIMISATION: Remplace source='get_<champ>_display', qui passe par une
+    méthode générée du modèle pour chaque ligne, par une simple recherche
+    dans un dict construit une seule fois à la déclaration du serializer.
+    """
+
+    def __init__(self, choices, **kwargs):
+        """
+        Args:
+            choices (list): Couples (valeur, libellé) du champ
+            **kwargs: Arguments nommés pour ReadOnlyField (source requis)
+        """
+        self.labels = dict(choices)
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """
+        Args:
+            value (str): Valeur stockée du choix
+
+        Returns:
+            str: Libellé du choix, ou la valeur brute si elle est inconnue
+        """
+        return self.labels.get(value, value)
+
+
+class ProjectSerializer(SparseFieldsetsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer pour le modèle Project
     - Gère la création et l'affichage des projets
     - L'auteur est automatiquement défini comme l'utilisateur connecté
-    - Calcule le nombre de contributeurs pour l'affichage
+    - Affiche le nombre de contributeurs (compteur dénormalisé)
     """
     # Affiche le username de l'auteur au lieu de son ID (plus lisible)
-    author = serializers.StringRelatedField(read_only=True)
-    # Champ calculé : nombre de contributeurs du projet
-    contributors_count = serializers.SerializerMethodField()
+    # OPTIMISATION: Lecture directe de l'attribut, sans appel à User.__str__
+    author = serializers.CharField(source='author.username', read_only=True)
+    # Nombre de contributeurs du projet
+    # OPTIMISATION: Lu depuis le compteur dénormalisé, sans requête COUNT par projet
+    contributors_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Project
         fields = ['id', 'name', 'description', 'type', 'author', 'contributors_count', 'created_time']
         read_only_fields = ['author', 'created_time']  # Ces champs sont auto-générés
 
-    def get_contributors_count(self, obj):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Méthode pour calculer le nombre de contributeurs.
-        Utilisée par le SerializerMethodField 'contributors_count'.
+        OPTIMISATION: Joint l'auteur en ne chargeant que son username
+        (pas de hash de mot de passe ni de champs RGPD).
 
         Args:
-            obj (Project): L'instance du projet
+            queryset (QuerySet): Projets à sérialiser
 
         Returns:
-            int: Le nombre de contributeurs du projet
+            QuerySet: Projets avec auteur joint
         """
-        return obj.contributors.count()
+        return queryset.select_related('author').only(
+            'id', 'name', 'description', 'type', 'author', 'contributors_count', 'created_time',
+            'author__username'
+        )
 
     def create(self, validated_data):
         """
         Création d'un nouveau projet.
         - L'auteur devient automatiquement l'utilisateur connecté
-        - L'ajout comme contributeur est géré dans la vue
+        - L'auteur est ajouté comme contributeur dans la même transaction
 
         Args:
             validated_data (dict): Les données validées du projet
@@ -166,10 +300,50 @@ class ProjectSerializer(serializers.ModelSerializer):
         """
         # L'auteur est automatiquement défini comme l'utilisateur connecté
         validated_data['author'] = self.context['request'].user
-        project = Project.objects.create(**validated_data)
+        with transaction.atomic():
+            # OPTIMISATION: Compteur initialisé à 1 directement à l'INSERT ;
+            # bulk_create n'émet pas post_save, le signal ne le ré-incrémente donc pas
+            project = Project.objects.create(contributors_count=1, **validated_data)
+            Contributor.objects.bulk_create([Contributor(user=project.author, project=project)])
         return project
 
 
+def serialize_project_rows(rows, fields=None):
+    """
+    Sérialise des projets issus d'une projection values().
+
+    OPTIMISATION: Même sortie que ProjectSerializer pour la liste des
+    projets, sans instancier de modèles Project/User ni passer par les
+    champs DRF pour chaque ligne.
+
+    Args:
+        rows (iterable): Lignes values() contenant les clés de PROJECT_VALUES
+        fields (set): Champs demandés (?fields=), None pour tous
+
+    Returns:
+        list: Projets sérialisés
+    """
+    projects = [
+        {
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'type': row['type'],
+            'author': row['author__username'],
+            'contributors_count': row['contributors_count'],
+            'created_time': row['created_time'],
+        }
+        for row in rows
+    ]
+    if fields:
+        projects = [{key: value for key, value in project.items() if key in fields} for project in projects]
+    return projects
+
+
+# Colonnes nécessaires à serialize_project_rows
+PROJECT_VALUES = ('id', 'name', 'description', 'type', 'author__username', 'contributors_count', 'created_time')
+
+
 class ContributorSerializer(serializers.ModelSerializer):
     """
     Serializer pour le modèle Contributor (lecture/affichage)
@@ -186,26 +360,105 @@ class ContributorSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'user_username', 'project', 'project_name', 'created_time']
         read_only_fields = ['created_time']
 
-    def validate(self, data):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Validation pour éviter les contributeurs en double.
-        Vérifie qu'un utilisateur n'est pas déjà contributeur du même projet.
+        OPTIMISATION: Joint les relations lues par le serializer (user, project)
+        en ne chargeant que les colonnes affichées.
 
         Args:
-            data (dict): Données contenant 'user' et 'project'
+            queryset (QuerySet): Contributeurs à sérialiser
 
         Returns:
-            dict: Les données validées
+            QuerySet: Contributeurs avec relations jointes
+        """
+        return queryset.select_related('user', 'project').only(
+            'id', 'user', 'project', 'created_time',
+            'user__username', 'project__name'
+        )
 
-        Raises:
-            ValidationError: Si l'utilisateur est déjà contributeur
+
+def serialize_contributor_rows(rows):
+    """
+    Sérialise des contributeurs issus d'une projection values().
+
+    OPTIMISATION: Produit la même sortie que ContributorSerializer sans
+    instancier de modèles Contributor/User/Project ni passer par les champs
+    DRF pour chaque ligne (listes volumineuses).
+
+    Args:
+        rows (iterable): Lignes values() contenant les clés de CONTRIBUTOR_VALUES
+
+    Returns:
+        list: Contributeurs sérialisés
+    """
+    return [
+        {
+            'id': row['id'],
+            'user': row['user_id'],
+            'user_username': row['user__username'],
+            'project': row['project_id'],
+            'project_name': row['project__name'],
+            'created_time': row['created_time'],
+        }
+        for row in rows
+    ]
+
+
+# Colonnes nécessaires à serialize_contributor_rows
+CONTRIBUTOR_VALUES = ('id', 'user_id', 'user__username', 'project_id', 'project__name', 'created_time')
+
+
+class ContributorListCreateSerializer(serializers.ListSerializer):
+    """
+    Serializer de liste pour l'ajout de contributeurs en lot (POST d'un tableau)
+    - Résout tous les usernames en une requête
+    - Ajoute tous les contributeurs en INSERT groupés (doublons ignorés)
+    """
+
+    def to_internal_value(self, data):
         """
-        # Vérifier que l'utilisateur n'est pas déjà contributeur
-        if Contributor.objects.filter(user=data['user'], project=data['project']).exists():
-            raise serializers.ValidationError(
-                "Cet utilisateur est déjà contributeur de ce projet."
-            )
-        return data
+        Précharge les utilisateurs du lot avant la validation de chaque élément.
+
+        OPTIMISATION: Un seul SELECT ... WHERE username IN (...) alimente le
+        cache de validate_username, au lieu d'une requête par username.
+
+        Args:
+            data (list): Liste des contributeurs à valider
+
+        Returns:
+            list: Les données validées
+        """
+        if isinstance(data, list):
+            usernames = {
+                item.get('username') for item in data
+                if isinstance(item, dict) and isinstance(item.get('username'), str)
+            }
+            users = User.objects.only('id', 'username').in_bulk(usernames, field_name='username')
+            cache = self._context.setdefault('_user_cache', {})
+            for username in usernames:
+                # None mémorise l'absence : validate_username lèvera l'erreur
+                cache[username] = users.get(username)
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """
+        Ajout groupé des contributeurs.
+
+        Les utilisateurs déjà contributeurs du projet sont ignorés, ce qui
+        rend l'ajout en lot idempotent.
+
+        Args:
+            validated_data (list): Données validées de chaque contributeur
+
+        Returns:
+            list: Les contributeurs ajoutés
+        """
+        project = validated_data[0]['project'] if validated_data else None
+        if project is None:
+            return []
+        with transaction.atomic():
+            return Contributor.bulk_add(project, [attrs['username'] for attrs in validated_data])
 
 
 class ContributorCreateSerializer(serializers.ModelSerializer):
@@ -221,6 +474,7 @@ class ContributorCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Contributor
         fields = ['username']  # Seul le username est nécessaire
+        list_serializer_class = ContributorListCreateSerializer
 
     def validate_username(self, value):
         """
@@ -237,18 +491,25 @@ class ContributorCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: Si l'utilisateur n'existe pas
         """
-        try:
-            user = User.objects.get(username=value)
-            return user
-        except User.DoesNotExist:
+        # OPTIMISATION: Résultats mémorisés dans le contexte, partagé pour toute
+        # la requête : un même username n'est recherché qu'une fois
+        cache = self.context.setdefault('_user_cache', {})
+        if value not in cache:
+            try:
+                cache[value] = get_user_by_username(value)
+            except User.DoesNotExist:
+                cache[value] = None
+        user = cache[value]
+        if user is None:
             raise serializers.ValidationError("Utilisateur non trouvé.")
+        return user
 
     def create(self, validated_data):
         """
         Création d'un nouveau contributeur.
         - Récupère l'utilisateur depuis le username validé
         - Le projet est passé directement depuis la vue via save(project=project)
-        - Vérifie qu'il n'est pas déjà contributeur
+        - Les doublons sont rejetés par la contrainte d'unicité en base
 
         Args:
             validated_data (dict): Données contenant 'username' et 'project'
@@ -262,16 +523,18 @@ class ContributorCreateSerializer(serializers.ModelSerializer):
         user = validated_data.pop('username')  # Récupère l'objet User validé
         project = validated_data.pop('project')  # Récupère le projet depuis save()
 
-        # Double vérification : éviter les contributeurs en double
-        if Contributor.objects.filter(user=user, project=project).exists():
+        # OPTIMISATION: Pas de SELECT préalable, la contrainte d'unicité (user, project)
+        # détecte les doublons à l'INSERT, y compris en cas de requêtes concurrentes
+        try:
+            with transaction.atomic():
+                return Contributor.objects.create(user=user, project=project)
+        except IntegrityError:
             raise serializers.ValidationError(
                 "Cet utilisateur est déjà contributeur de ce projet."
             )
 
-        return Contributor.objects.create(user=user, project=project)
 
-
-class IssueSerializer(serializers.ModelSerializer):
+class IssueSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer pour l'affichage et la gestion des Issues
     - Affiche les informations lisibles (noms au lieu d'IDs)
@@ -282,9 +545,9 @@ class IssueSerializer(serializers.ModelSerializer):
     project_name = serializers.CharField(source='project.name', read_only=True)
 
     # Choix disponibles pour les champs à choix multiples
-    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
-    tag_display = serializers.CharField(source='get_tag_display', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    priority_display = ChoiceDisplayField(Issue.PRIORITY_CHOICES, source='priority')
+    tag_display = ChoiceDisplayField(Issue.TAG_CHOICES, source='tag')
+    status_display = ChoiceDisplayField(Issue.STATUS_CHOICES, source='status')
 
     class Meta:
         model = Issue
@@ -296,6 +559,25 @@ class IssueSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['author', 'project', 'created_time', 'updated_time']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        OPTIMISATION: Joint les relations lues par le serializer (auteur, assigné, projet)
+        en ne chargeant que les colonnes affichées (pas de hash de mot de passe,
+        champs RGPD ou description du projet).
+
+        Args:
+            queryset (QuerySet): Issues à sérialiser
+
+        Returns:
+            QuerySet: Issues avec relations jointes
+        """
+        return queryset.select_related('author', 'assignee', 'project').only(
+            'id', 'name', 'description', 'project', 'author', 'assignee',
+            'priority', 'tag', 'status', 'created_time', 'updated_time',
+            'author__username', 'assignee__username', 'project__name'
+        )
+
     def __init__(self, *args, **kwargs):
         """
         Initialisation dynamique pour limiter les assignés aux contributeurs du projet.
@@ -306,13 +588,23 @@ class IssueSerializer(serializers.ModelSerializer):
         """
         super().__init__(*args, **kwargs)
 
-        # Si on a un contexte avec le projet, limiter les assignés
-        if 'project' in self.context:
-            project = self.context['project']
+        # Sans projet dans le contexte (listes), les champs ne sont pas touchés
+        if 'project' not in self.context:
+            return
+
+        project = self.context['project']
+        # OPTIMISATION: Queryset des assignés construit une fois par projet et par
+        # requête (DRF le clone à chaque utilisation, le partage est donc sans risque)
+        request = self.context.get('request')
+        cache = getattr(request, '_assignee_querysets', None)
+        if cache is None:
+            cache = {}
+            if request is not None:
+                request._assignee_querysets = cache
+        if project.pk not in cache:
             # Limiter le queryset aux contributeurs du projet
-            self.fields['assignee'].queryset = User.objects.filter(
-                contributions__project=project
-            )
+            cache[project.pk] = User.objects.filter(contributions__project=project)
+        self.fields['assignee'].queryset = cache[project.pk]
 
     def validate_assignee(self, value):
         """
@@ -329,13 +621,68 @@ class IssueSerializer(serializers.ModelSerializer):
         """
         if value and 'project' in self.context:
             project = self.context['project']
-            if not project.contributors.filter(user=value).exists():
+            # OPTIMISATION: Ids des contributeurs mémorisés sur le projet
+            if value.id not in project.contributor_user_ids():
                 raise serializers.ValidationError(
                     "L'utilisateur assigné doit être contributeur du projet."
                 )
         return value
 
 
+class IssueListCreateSerializer(serializers.ListSerializer):
+    """
+    Serializer de liste pour la création d'Issues en lot (POST d'un tableau)
+    - Résout tous les assignés en une requête
+    - Crée toutes les issues en un INSERT groupé
+    """
+
+    def to_internal_value(self, data):
+        """
+        Précharge les assignés du lot avant la validation de chaque élément.
+
+        OPTIMISATION: Un seul SELECT ... WHERE username IN (...) au lieu d'une
+        requête par issue dans validate_assignee_username.
+
+        Args:
+            data (list): Liste des issues à valider
+
+        Returns:
+            list: Les données validées
+        """
+        if isinstance(data, list):
+            usernames = {
+                item.get('assignee_username') for item in data
+                if isinstance(item, dict) and item.get('assignee_username')
+            }
+            self._context['users_by_username'] = User.objects.only('id', 'username').in_bulk(
+                usernames, field_name='username'
+            )
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """
+        Création groupée des issues.
+
+        Args:
+            validated_data (list): Données validées de chaque issue
+
+        Returns:
+            list: Les issues créées
+        """
+        project = self.context['project']
+        author = self.context['request'].user
+        issues = [
+            Issue(
+                project=project,
+                author=author,
+                assignee=attrs.pop('assignee_username', None),
+                **attrs
+            )
+            for attrs in validated_data
+        ]
+        return Issue.bulk_validate_and_create(issues)
+
+
 class IssueCreateSerializer(serializers.ModelSerializer):
     """
     Serializer simplifié pour la création d'Issues
@@ -355,6 +702,7 @@ class IssueCreateSerializer(serializers.ModelSerializer):
             'name', 'description', 'assignee_username',
             'priority', 'tag', 'status'
         ]
+        list_serializer_class = IssueListCreateSerializer
 
     def validate_assignee_username(self, value):
         """
@@ -373,10 +721,18 @@ class IssueCreateSerializer(serializers.ModelSerializer):
             return None
 
         try:
-            user = User.objects.get(username=value)
+            # Création en lot : assignés préchargés par IssueListCreateSerializer
+            users = self.context.get('users_by_username')
+            if users is not None:
+                user = users.get(value)
+                if user is None:
+                    raise User.DoesNotExist
+            else:
+                user = get_user_by_username(value)
             # Vérifier que l'utilisateur est contributeur du projet
+            # OPTIMISATION: Ids des contributeurs mémorisés sur le projet
             project = self.context['project']
-            if not project.contributors.filter(user=user).exists():
+            if user.id not in project.contributor_user_ids():
                 raise serializers.ValidationError(
                     f"L'utilisateur '{value}' n'est pas contributeur de ce projet."
                 )
@@ -444,10 +800,11 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
             return None
 
         try:
-            user = User.objects.get(username=value)
+            user = get_user_by_username(value)
             # Vérifier que l'utilisateur est contributeur du projet
+            # OPTIMISATION: Ids des contributeurs mémorisés sur le projet
             issue = self.instance
-            if not issue.project.contributors.filter(user=user).exists():
+            if user.id not in issue.project.contributor_user_ids():
                 raise serializers.ValidationError(
                     f"L'utilisateur '{value}' n'est pas contributeur de ce projet."
                 )
@@ -459,6 +816,9 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
         """
         Mise à jour avec gestion de l'assigné.
 
+        OPTIMISATION: Seules les colonnes réellement modifiées sont écrites
+        (save(update_fields=...)) ; aucune requête si rien ne change.
+
         Args:
             instance (Issue): L'instance issue à mettre à jour
             validated_data (dict): Les données validées
@@ -467,20 +827,110 @@ class IssueUpdateSerializer(serializers.ModelSerializer):
             Issue: L'instance issue mise à jour
         """
         assignee = validated_data.pop('assignee_username', 'no_change')
+        changed = []
 
-        # Mettre à jour l'assigné seulement si le champ est fourni
+        # Mettre à jour l'assigné seulement si le champ est fourni et différent
+        # (comparaison sur assignee_id pour ne pas charger l'assigné actuel)
         if assignee != 'no_change':
-            instance.assignee = assignee
+            assignee_id = assignee.id if assignee else None
+            if instance.assignee_id != assignee_id:
+                instance.assignee = assignee
+                changed.append('assignee')
 
         # Mettre à jour les autres champs
         for attr, value in validated_data.items():
-            setattr(instance, attr, value)
+            if getattr(instance, attr) != value:
+                setattr(instance, attr, value)
+                changed.append(attr)
 
-        instance.save()
+        if changed:
+            # updated_time (auto_now) n'est rafraîchi que s'il figure dans update_fields
+            instance.save(update_fields=changed + ['updated_time'])
         return instance
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class IssueBulkUpdateSerializer(serializers.Serializer):
+    """
+    Serializer pour la modification en lot d'Issues (ex : clôturer un sprint)
+    - Les issues sont désignées par leurs ids
+    - Seuls priorité, balise, statut et assigné peuvent être modifiés
+    """
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+    priority = serializers.ChoiceField(choices=Issue.PRIORITY_CHOICES, required=False)
+    tag = serializers.ChoiceField(choices=Issue.TAG_CHOICES, required=False)
+    status = serializers.ChoiceField(choices=Issue.STATUS_CHOICES, required=False)
+    assignee_username = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text="Username du contributeur à assigner (laisser vide pour désassigner)"
+    )
+
+    def validate_assignee_username(self, value):
+        """
+        Validation de l'assigné, une seule fois pour tout le lot.
+
+        Args:
+            value (str): Le nom d'utilisateur de l'assigné ou chaîne vide
+
+        Returns:
+            User: L'utilisateur trouvé ou None si valeur vide
+
+        Raises:
+            ValidationError: Si l'utilisateur n'existe pas ou n'est pas contributeur
+        """
+        if not value:  # Si vide, désassigner
+            return None
+
+        try:
+            user = get_user_by_username(value)
+        except User.DoesNotExist:
+            raise serializers.ValidationError(f"L'utilisateur '{value}' n'existe pas.")
+        if user.id not in self.context['project'].contributor_user_ids():
+            raise serializers.ValidationError(
+                f"L'utilisateur '{value}' n'est pas contributeur de ce projet."
+            )
+        return user
+
+    def validate(self, data):
+        """
+        Vérifie qu'au moins un champ est à modifier.
+
+        Args:
+            data (dict): Les données à valider
+
+        Returns:
+            dict: Les données validées
+
+        Raises:
+            ValidationError: Si seuls les ids sont fournis
+        """
+        if len(data) == 1:
+            raise serializers.ValidationError("Aucun champ à modifier.")
+        return data
+
+    def apply_to(self, queryset):
+        """
+        Applique les modifications à toutes les issues désignées.
+
+        OPTIMISATION: Un seul UPDATE ... WHERE id IN (...) au lieu d'un
+        chargement et d'un save() par issue.
+
+        Args:
+            queryset (QuerySet): Issues à modifier, déjà contrôlées par la vue
+
+        Returns:
+            int: Nombre d'issues modifiées
+        """
+        changes = dict(self.validated_data)
+        ids = changes.pop('ids')
+        if 'assignee_username' in changes:
+            changes['assignee'] = changes.pop('assignee_username')
+        # update() ne passe pas par save() : auto_now doit être renseigné ici
+        changes['updated_time'] = timezone.now()
+        return queryset.filter(pk__in=ids).update(**changes)
+
+
+class CommentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer pour l'affichage et la gestion des commentaires
     - Affiche les informations lisibles (noms au lieu d'IDs)
@@ -498,6 +948,64 @@ class CommentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'author', 'issue', 'created_time']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        OPTIMISATION: Joint les relations lues par le serializer (auteur, issue, projet)
+        en ne chargeant que les colonnes affichées.
+
+        Args:
+            queryset (QuerySet): Commentaires à sérialiser
+
+        Returns:
+            QuerySet: Commentaires avec relations jointes
+        """
+        return queryset.select_related('author', 'issue__project').only(
+            'id', 'description', 'issue', 'author', 'project', 'created_time',
+            'author__username', 'issue__name', 'issue__project__name'
+        )
+
+
+# Colonne values() lue pour chaque champ de CommentSerializer.Meta.fields
+COMMENT_COLUMNS = {
+    'id': 'id',
+    'description': 'description',
+    'issue': 'issue_id',
+    'issue_name': 'issue__name',
+    'project_name': 'issue__project__name',
+    'author': 'author_id',
+    'author_username': 'author__username',
+    'created_time': 'created_time',
+}
+
+# Colonnes nécessaires à serialize_comment_rows, dans l'ordre de Meta.fields
+# (KeyError à l'import si un champ ajouté à Meta.fields n'a pas de colonne)
+COMMENT_VALUES = tuple(COMMENT_COLUMNS[name] for name in CommentSerializer.Meta.fields)
+
+
+def serialize_comment_rows(rows):
+    """
+    Sérialise des commentaires issus d'une projection values().
+
+    OPTIMISATION: Même sortie que CommentSerializer pour la liste des
+    commentaires, sans instancier de modèles Comment/Issue/User ni passer
+    par les champs DRF pour chaque ligne. Les clés suivent Meta.fields ;
+    l'UUID et la date sont convertis comme par UUIDField et DateTimeField,
+    la sortie ne dépend donc pas du renderer.
+
+    Args:
+        rows (iterable): Lignes values() contenant les clés de COMMENT_VALUES
+
+    Returns:
+        list: Commentaires sérialisés
+    """
+    converters = {'id': str, 'created_time': serializers.DateTimeField().to_representation}
+    plan = [(name, COMMENT_COLUMNS[name], converters.get(name)) for name in CommentSerializer.Meta.fields]
+    return [
+        {name: convert(row[column]) if convert else row[column] for name, column, convert in plan}
+        for row in rows
+    ]
+
 
 class CommentCreateSerializer(serializers.ModelSerializer):
     """
@@ -523,13 +1031,21 @@ class CommentCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: Si l'auteur n'est pas contributeur du projet
         """
-        # L'issue et l'auteur sont passés via le contexte
+        # L'issue, son projet annoté et la requête sont passés via le contexte
         issue = self.context.get('issue')
-        author = self.context.get('request').user
+        project = self.context.get('project')
+        request = self.context.get('request')
 
-        if issue and author:
+        if issue and request:
             # Vérifier que l'auteur est contributeur du projet
-            if not issue.project.contributors.filter(user=author).exists():
+            # OPTIMISATION: Réutilise l'appartenance déjà vérifiée par la vue
+            # (projet annoté par get_issue) au lieu d'une nouvelle requête
+            is_member = None
+            if project is not None and project.pk == issue.project_id:
+                is_member = getattr(project, 'is_member', None)
+            if is_member is None:
+                is_member = issue.project_id in contributor_project_ids(request)
+            if not is_member:
                 raise serializers.ValidationError(
                     "Vous devez être contributeur du projet pour commenter cette issue."
                 )
@@ -551,6 +1067,7 @@ class CommentCreateSerializer(serializers.ModelSerializer):
 
         comment = Comment.objects.create(
             issue=issue,
+            project_id=issue.project_id,
             author=author,
             **validated_data
         )
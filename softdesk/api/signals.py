@@ -0,0 +1,58 @@
+"""
+Signaux de l'API SoftDesk
+
+Ce module maintient les données dénormalisées des modèles, comme le
+compteur de contributeurs d'un projet, et invalide les caches associés.
+"""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Project, Contributor
+
+
+def _clear_contributor_cache(instance):
+    """
+    Invalide les ids de contributeurs mémorisés sur le projet lié, s'il est chargé.
+
+    Args:
+        instance (Contributor): Le contributeur ajouté ou supprimé
+    """
+    if Contributor.project.is_cached(instance):
+        instance.project._contrib_ids = None
+
+
+@receiver(post_save, sender=Contributor)
+def increment_contributors_count(sender, instance, created, raw=False, **kwargs):
+    """
+    Incrémente le compteur du projet à l'ajout d'un contributeur.
+
+    Utilise une expression F() pour que la mise à jour soit atomique en base.
+
+    Args:
+        sender: La classe Contributor
+        instance (Contributor): Le contributeur sauvegardé
+        created (bool): True si le contributeur vient d'être créé
+        raw (bool): True lors du chargement de fixtures (compteur déjà fourni)
+    """
+    if created and not raw:
+        Project.objects.filter(pk=instance.project_id).update(
+            contributors_count=F('contributors_count') + 1
+        )
+        _clear_contributor_cache(instance)
+
+
+@receiver(post_delete, sender=Contributor)
+def decrement_contributors_count(sender, instance, **kwargs):
+    """
+    Décrémente le compteur du projet au retrait d'un contributeur.
+
+    Args:
+        sender: La classe Contributor
+        instance (Contributor): Le contributeur supprimé
+    """
+    Project.objects.filter(pk=instance.project_id, contributors_count__gt=0).update(
+        contributors_count=F('contributors_count') - 1
+    )
+    _clear_contributor_cache(instance)
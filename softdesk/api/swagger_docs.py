@@ -8,9 +8,20 @@ from drf_yasg import openapi
 from .serializers import (
     UserSerializer, LoginSerializer, ProjectSerializer,
     ContributorSerializer, IssueSerializer, CommentSerializer,
-    IssueCreateSerializer, CommentCreateSerializer
+    IssueCreateSerializer, IssueBulkUpdateSerializer, CommentCreateSerializer
 )
 
+# ===============================
+# RÉPONSES PARTAGÉES
+# ===============================
+
+# OPTIMISATION: Une seule instance de liste par serializer, construite à l'import
+# et réutilisée par toutes les documentations qui en ont besoin
+PROJECT_LIST_RESPONSE = ProjectSerializer(many=True)
+CONTRIBUTOR_LIST_RESPONSE = ContributorSerializer(many=True)
+ISSUE_LIST_RESPONSE = IssueSerializer(many=True)
+COMMENT_LIST_RESPONSE = CommentSerializer(many=True)
+
 # ===============================
 # AUTHENTIFICATION
 # ===============================
@@ -109,10 +120,18 @@ refresh_token_docs = swagger_auto_schema(
 # PROJETS
 # ===============================
 
+# Paramètre de sélection des champs (sparse fieldsets)
+fields_param = openapi.Parameter(
+    'fields', openapi.IN_QUERY,
+    description="Champs à renvoyer, séparés par des virgules (ex: id,name)",
+    type=openapi.TYPE_STRING
+)
+
 project_list_docs = swagger_auto_schema(
     operation_summary="Liste des projets",
     operation_description="Retourne la liste des projets où l'utilisateur est contributeur",
-    responses={200: ProjectSerializer(many=True)}
+    manual_parameters=[fields_param],
+    responses={200: PROJECT_LIST_RESPONSE}
 )
 
 project_create_docs = swagger_auto_schema(
@@ -130,6 +149,7 @@ project_create_docs = swagger_auto_schema(
 project_retrieve_docs = swagger_auto_schema(
     operation_summary="Détail d'un projet",
     operation_description="Affiche les détails d'un projet (contributeurs uniquement)",
+    manual_parameters=[fields_param],
     responses={
         200: ProjectSerializer,
         403: "Accès refusé (non-contributeur)",
@@ -177,7 +197,7 @@ contributor_list_docs = swagger_auto_schema(
     operation_summary="Liste des contributeurs",
     operation_description="Liste tous les contributeurs d'un projet",
     responses={
-        200: ContributorSerializer(many=True),
+        200: CONTRIBUTOR_LIST_RESPONSE,
         403: "Accès refusé (non-contributeur)",
         404: "Projet non trouvé"
     },
@@ -186,7 +206,10 @@ contributor_list_docs = swagger_auto_schema(
 
 contributor_add_docs = swagger_auto_schema(
     operation_summary="Ajouter un contributeur",
-    operation_description="Ajoute un utilisateur comme contributeur du projet (auteur uniquement)",
+    operation_description="""
+    Ajoute un utilisateur comme contributeur du projet (auteur uniquement).
+    Un tableau de usernames peut être envoyé pour un ajout en lot.
+    """,
     responses={
         201: ContributorSerializer,
         400: "Utilisateur déjà contributeur ou non trouvé",
@@ -214,7 +237,7 @@ issue_list_docs = swagger_auto_schema(
     operation_summary="Liste des issues",
     operation_description="Liste toutes les issues d'un projet",
     responses={
-        200: IssueSerializer(many=True),
+        200: ISSUE_LIST_RESPONSE,
         403: "Accès refusé (non-contributeur)"
     },
     tags=['issues']
@@ -225,6 +248,8 @@ issue_create_docs = swagger_auto_schema(
     operation_description="""
     Crée une nouvelle issue dans un projet.
     L'assigné doit être un contributeur du projet.
+    Un tableau d'issues peut être envoyé pour une création en lot
+    (la réponse est alors un tableau).
     """,
     request_body=IssueCreateSerializer,
     responses={
@@ -268,6 +293,36 @@ issue_partial_update_docs = swagger_auto_schema(
     tags=['issues']
 )
 
+issue_bulk_update_docs = swagger_auto_schema(
+    operation_summary="Modifier des issues en lot",
+    operation_description="""
+    Modifie la priorité, la balise, le statut ou l'assigné de plusieurs issues
+    en une seule requête. L'auteur du projet peut modifier toutes les issues,
+    les autres contributeurs uniquement celles dont ils sont l'auteur.
+    Le lot est refusé en entier si un id n'appartient pas au projet (400)
+    ou désigne une issue non modifiable par l'utilisateur (403) : les ids
+    rejetés sont listés dans la réponse.
+    """,
+    request_body=IssueBulkUpdateSerializer,
+    responses={
+        200: openapi.Response(
+            description="Nombre d'issues modifiées",
+            examples={"application/json": {"updated": 3}}
+        ),
+        400: openapi.Response(
+            description="Données invalides, assigné non-contributeur ou issues hors du projet",
+            examples={"application/json": {"error": "Issues introuvables dans ce projet", "ids": [42]}}
+        ),
+        403: openapi.Response(
+            description="Accès refusé (non-contributeur ou issues d'autres auteurs)",
+            examples={"application/json": {
+                "error": "Seul l'auteur de l'issue ou du projet peut la modifier", "ids": [7]
+            }}
+        )
+    },
+    tags=['issues']
+)
+
 issue_destroy_docs = swagger_auto_schema(
     operation_summary="Supprimer une issue",
     operation_description="Supprime définitivement une issue (auteur de l'issue ou du projet)",
@@ -287,7 +342,7 @@ comment_list_docs = swagger_auto_schema(
     operation_summary="Liste des commentaires",
     operation_description="Liste tous les commentaires d'une issue",
     responses={
-        200: CommentSerializer(many=True),
+        200: COMMENT_LIST_RESPONSE,
         403: "Accès refusé (non-contributeur)"
     },
     tags=['comments']
@@ -0,0 +1,520 @@
+"""
+Tests de l'API SoftDesk
+
+Ce module vérifie les comportements introduits par les optimisations :
+stockage des choix en entiers, contrôles d'appartenance sans requête
+supplémentaire, opérations en lot, compteurs dénormalisés et pagination.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from .fields import ChoiceCodeField
+from .models import User, Project, Contributor, Issue, Comment
+from .permissions import projects_with_membership
+from .serializers import CommentCreateSerializer, CommentSerializer, UserSerializer
+
+
+def membership_queries(context):
+    """
+    Requêtes de contributor_project_ids (ids des projets de l'utilisateur).
+
+    Args:
+        context (CaptureQueriesContext): Requêtes capturées
+
+    Returns:
+        list: Requêtes SQL de lecture des appartenances de l'utilisateur
+    """
+    return [
+        query['sql'] for query in context.captured_queries
+        if query['sql'].startswith('SELECT "api_contributor"."project_id" ')
+    ]
+
+
+class SoftDeskAPITestCase(APITestCase):
+    """
+    Données communes : un projet, son auteur, un contributeur et un non-membre.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('alice', password='pw-Str0ng!x')
+        cls.member = User.objects.create_user('bob', password='pw-Str0ng!x')
+        cls.outsider = User.objects.create_user('carol', password='pw-Str0ng!x')
+        cls.project = Project.objects.create(
+            name='Projet', description='Description', type=Project.Type.BACKEND, author=cls.author
+        )
+        Contributor.objects.create(user=cls.author, project=cls.project)
+        Contributor.objects.create(user=cls.member, project=cls.project)
+
+    def create_issue(self, author=None, **kwargs):
+        """
+        Crée une issue dans le projet commun.
+
+        Args:
+            author (User): Auteur de l'issue (l'auteur du projet par défaut)
+            **kwargs: Champs supplémentaires de l'issue
+
+        Returns:
+            Issue: L'issue créée
+        """
+        kwargs.setdefault('name', 'Issue')
+        kwargs.setdefault('description', 'Description')
+        return Issue.objects.create(project=self.project, author=author or self.author, **kwargs)
+
+    def issues_url(self, project=None):
+        """
+        Args:
+            project (Project): Projet ciblé (le projet commun par défaut)
+
+        Returns:
+            str: URL de la liste des issues du projet
+        """
+        return reverse('issues-list', kwargs={'project_pk': (project or self.project).pk})
+
+    def issue_url(self, issue):
+        """
+        Args:
+            issue (Issue): Issue ciblée
+
+        Returns:
+            str: URL du détail de l'issue
+        """
+        return reverse('issues-detail', kwargs={'project_pk': issue.project_id, 'pk': issue.pk})
+
+    def comments_url(self, issue):
+        """
+        Args:
+            issue (Issue): Issue ciblée
+
+        Returns:
+            str: URL de la liste des commentaires de l'issue
+        """
+        return reverse('comments-list', kwargs={'project_pk': issue.project_id, 'issue_pk': issue.pk})
+
+
+class ChoiceCodeFieldTests(SoftDeskAPITestCase):
+    """Stockage des choix en entiers courts (ChoiceCodeField)."""
+
+    def test_choices_are_stored_as_explicit_codes(self):
+        self.client.force_authenticate(self.author)
+        response = self.client.post(self.issues_url(), {
+            'name': 'Issue', 'description': 'Description',
+            'priority': 'HIGH', 'tag': 'BUG', 'status': 'IN_PROGRESS',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertEqual(response.json()['status'], 'IN_PROGRESS')
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT priority, tag, status FROM api_issue WHERE id = %s', [response.json()['id']])
+            self.assertEqual(cursor.fetchone(), (
+                Issue.PRIORITY_CODES[Issue.Priority.HIGH],
+                Issue.TAG_CODES[Issue.Tag.BUG],
+                Issue.STATUS_CODES[Issue.Status.IN_PROGRESS],
+            ))
+
+    def test_filters_use_the_textual_key(self):
+        self.create_issue(status=Issue.Status.FINISHED)
+        self.create_issue(status=Issue.Status.TO_DO)
+        self.assertEqual(Issue.objects.filter(status='FINISHED').count(), 1)
+        self.assertEqual(Issue.objects.filter(status__in=['TO_DO', 'FINISHED']).count(), 2)
+
+    def test_invalid_choice_is_rejected_by_the_api(self):
+        self.client.force_authenticate(self.author)
+        response = self.client.post(self.issues_url(), {
+            'name': 'Issue', 'description': 'Description', 'status': 'UNKNOWN',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Issue.objects.exists())
+
+    def test_unknown_int_code_is_rejected(self):
+        field = Issue._meta.get_field('status')
+        self.assertEqual(field.get_prep_value(Issue.STATUS_CODES[Issue.Status.FINISHED]),
+                         Issue.STATUS_CODES[Issue.Status.FINISHED])
+        with self.assertRaises(ValueError):
+            field.get_prep_value(99)
+
+    def test_codes_must_cover_choices_with_unique_values(self):
+        choices = [('a', 'A'), ('b', 'B')]
+        with self.assertRaises(ImproperlyConfigured):
+            ChoiceCodeField(choices=choices, codes={'a': 1})
+        with self.assertRaises(ImproperlyConfigured):
+            ChoiceCodeField(choices=choices, codes={'a': 1, 'b': 1})
+        with self.assertRaises(ImproperlyConfigured):
+            ChoiceCodeField(choices=choices)
+
+
+class ChoiceCodesMigrationTests(TransactionTestCase):
+    """Conversion des clés textuelles en codes par la migration 0011."""
+
+    before = [('api', '0010_comment_uuid7')]
+    after = [('api', '0011_choice_codes')]
+
+    def migrate(self, targets):
+        """
+        Applique les migrations jusqu'aux cibles.
+
+        Args:
+            targets (list): Couples (application, migration) à atteindre
+
+        Returns:
+            Apps: Registre des modèles historiques à ces cibles
+        """
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        self.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_forward_and_backward_conversion(self):
+        apps = self.migrate(self.before)
+        user = apps.get_model('api', 'User').objects.create(username='alice')
+        project = apps.get_model('api', 'Project').objects.create(
+            name='Projet', description='Description', type='ios', author=user
+        )
+        apps.get_model('api', 'Issue').objects.create(
+            name='Issue', description='Description', project=project, author=user,
+            priority='HIGH', tag='BUG', status='IN_PROGRESS'
+        )
+
+        self.migrate(self.after)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT type FROM api_project')
+            self.assertEqual(cursor.fetchone(), (Project.TYPE_CODES[Project.Type.IOS],))
+            cursor.execute('SELECT priority, tag, status FROM api_issue')
+            self.assertEqual(cursor.fetchone(), (
+                Issue.PRIORITY_CODES[Issue.Priority.HIGH],
+                Issue.TAG_CODES[Issue.Tag.BUG],
+                Issue.STATUS_CODES[Issue.Status.IN_PROGRESS],
+            ))
+
+        self.migrate(self.before)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT priority, tag, status FROM api_issue')
+            self.assertEqual(cursor.fetchone(), ('HIGH', 'BUG', 'IN_PROGRESS'))
+
+
+class IsContributorTests(SoftDeskAPITestCase):
+    """Contrôle d'appartenance réutilisant le projet annoté par la vue."""
+
+    def test_issue_detail_reuses_view_membership(self):
+        issue = self.create_issue()
+        self.client.force_authenticate(self.member)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.issue_url(issue))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(membership_queries(context), [])
+
+    def test_comment_detail_reuses_view_membership(self):
+        issue = self.create_issue()
+        comment = Comment.objects.create(description='Commentaire', issue=issue, author=self.author)
+        url = reverse('comments-detail', kwargs={
+            'project_pk': self.project.pk, 'issue_pk': issue.pk, 'pk': comment.pk
+        })
+        self.client.force_authenticate(self.member)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(membership_queries(context), [])
+
+    def test_outsider_is_refused(self):
+        issue = self.create_issue()
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.client.get(self.issue_url(issue)).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.client.get(self.comments_url(issue)).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_issue_of_another_project_is_not_found(self):
+        other = Project.objects.create(
+            name='Autre', description='Description', type=Project.Type.IOS, author=self.outsider
+        )
+        Contributor.objects.create(user=self.outsider, project=other)
+        foreign_issue = Issue.objects.create(
+            name='Issue', description='Description', project=other, author=self.outsider
+        )
+        url = reverse('issues-detail', kwargs={'project_pk': self.project.pk, 'pk': foreign_issue.pk})
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_project_detail_only_for_members(self):
+        url = reverse('projects-detail', kwargs={'pk': self.project.pk})
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+
+class IssueBulkUpdateTests(SoftDeskAPITestCase):
+    """Modification en lot des issues (PATCH sur la liste des issues)."""
+
+    def setUp(self):
+        self.own = self.create_issue(author=self.member)
+        self.other = self.create_issue(author=self.author)
+
+    def test_project_author_updates_all_issues_in_one_update(self):
+        self.client.force_authenticate(self.author)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(self.issues_url(), {
+                'ids': [self.own.pk, self.other.pk], 'status': 'FINISHED', 'assignee_username': 'bob',
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.assertEqual(response.json(), {'updated': 2})
+        updates = [query for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        for issue in (self.own, self.other):
+            issue.refresh_from_db()
+            self.assertEqual((issue.status, issue.assignee_id), ('FINISHED', self.member.pk))
+
+    def test_contributor_updates_own_issues(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.patch(self.issues_url(), {'ids': [self.own.pk], 'priority': 'HIGH'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.own.refresh_from_db()
+        self.assertEqual(self.own.priority, 'HIGH')
+
+    def test_issues_of_other_authors_are_forbidden(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.patch(self.issues_url(), {
+            'ids': [self.own.pk, self.other.pk], 'priority': 'HIGH',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.json()['ids'], [self.other.pk])
+        self.assertFalse(Issue.objects.filter(priority='HIGH').exists())
+
+    def test_ids_outside_the_project_are_rejected(self):
+        other_project = Project.objects.create(
+            name='Autre', description='Description', type=Project.Type.IOS, author=self.author
+        )
+        foreign = Issue.objects.create(
+            name='Issue', description='Description', project=other_project, author=self.author
+        )
+        self.client.force_authenticate(self.author)
+        response = self.client.patch(self.issues_url(), {
+            'ids': [self.own.pk, foreign.pk, 999999], 'status': 'FINISHED',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['ids'], [foreign.pk, 999999])
+        self.assertFalse(Issue.objects.filter(status='FINISHED').exists())
+
+    def test_invalid_payloads_are_rejected(self):
+        self.client.force_authenticate(self.author)
+        for payload in (
+            {'ids': [self.own.pk]},
+            {'ids': [], 'status': 'FINISHED'},
+            {'ids': [self.own.pk], 'status': 'UNKNOWN'},
+            {'ids': [self.own.pk], 'assignee_username': 'carol'},
+        ):
+            with self.subTest(payload=payload):
+                response = self.client.patch(self.issues_url(), payload, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_blank_assignee_unassigns(self):
+        Issue.objects.filter(pk=self.own.pk).update(assignee=self.member)
+        self.client.force_authenticate(self.author)
+        response = self.client.patch(self.issues_url(), {
+            'ids': [self.own.pk], 'assignee_username': '',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self.own.refresh_from_db()
+        self.assertIsNone(self.own.assignee_id)
+
+    def test_outsider_is_refused(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.patch(self.issues_url(), {'ids': [self.own.pk], 'status': 'FINISHED'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CommentCreateTests(SoftDeskAPITestCase):
+    """Création de commentaires et contrôle d'appartenance de l'auteur."""
+
+    def setUp(self):
+        self.issue = self.create_issue()
+
+    def serializer_for(self, user, project):
+        """
+        Construit un CommentCreateSerializer comme le fait CommentViewSet.create.
+
+        Args:
+            user (User): Auteur du commentaire
+            project (Project): Projet passé dans le contexte (ou None)
+
+        Returns:
+            CommentCreateSerializer: Serializer lié aux données d'un commentaire
+        """
+        request = APIRequestFactory().post('/')
+        request.user = user
+        return CommentCreateSerializer(
+            data={'description': 'Commentaire'},
+            context={'issue': self.issue, 'project': project, 'request': request}
+        )
+
+    def test_member_comments_without_membership_query(self):
+        self.client.force_authenticate(self.member)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.comments_url(self.issue), {'description': 'Commentaire'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertEqual(membership_queries(context), [])
+        comment = Comment.objects.get(pk=response.json()['id'])
+        self.assertEqual((comment.author_id, comment.project_id), (self.member.pk, self.project.pk))
+
+    def test_outsider_cannot_comment(self):
+        self.client.force_authenticate(self.outsider)
+        response = self.client.post(self.comments_url(self.issue), {'description': 'Commentaire'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Comment.objects.exists())
+
+    def test_serializer_reads_membership_from_context_project(self):
+        request = APIRequestFactory().get('/')
+        request.user = self.outsider
+        project = projects_with_membership(request).get(pk=self.project.pk)
+        serializer = self.serializer_for(self.outsider, project)
+        self.assertFalse(serializer.is_valid())
+
+    def test_serializer_falls_back_without_context_project(self):
+        self.assertTrue(self.serializer_for(self.member, None).is_valid())
+        self.assertFalse(self.serializer_for(self.outsider, None).is_valid())
+
+
+class ContributorsCountTests(SoftDeskAPITestCase):
+    """Compteur dénormalisé Project.contributors_count."""
+
+    def contributors_url(self):
+        """
+        Returns:
+            str: URL de la liste des contributeurs du projet commun
+        """
+        return reverse('contributors-list', kwargs={'project_pk': self.project.pk})
+
+    def assertCount(self, expected):
+        """
+        Args:
+            expected (int): Valeur attendue du compteur en base
+        """
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.contributors_count, expected)
+
+    def test_project_creation_counts_the_author(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.post(reverse('projects-list'), {
+            'name': 'Nouveau', 'description': 'Description', 'type': 'ios',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertEqual(response.json()['contributors_count'], 1)
+        self.assertEqual(Project.objects.get(pk=response.json()['id']).contributors_count, 1)
+
+    def test_add_and_remove_contributor(self):
+        self.assertCount(2)
+        self.client.force_authenticate(self.author)
+        response = self.client.post(self.contributors_url(), {'username': 'carol'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertCount(3)
+        url = reverse('contributors-detail', kwargs={'project_pk': self.project.pk, 'pk': self.outsider.pk})
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertCount(2)
+
+    def test_bulk_add_ignores_existing_contributors(self):
+        dave = User.objects.create_user('dave', password='pw-Str0ng!x')
+        self.client.force_authenticate(self.author)
+        response = self.client.post(self.contributors_url(), [
+            {'username': 'carol'}, {'username': 'dave'},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertCount(4)
+        self.assertTrue(Contributor.objects.filter(project=self.project, user=dave).exists())
+
+        response = self.client.post(self.contributors_url(), [{'username': 'unknown'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertCount(4)
+
+    def test_stale_save_keeps_the_counter(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        Contributor.objects.create(user=self.outsider, project=self.project)
+        stale.name = 'Renommé'
+        stale.save()
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.name, self.project.contributors_count), ('Renommé', 3))
+
+
+class IssueTests(SoftDeskAPITestCase):
+    """Création en lot et cohérence du projet dénormalisé des commentaires."""
+
+    def test_bulk_create_issues(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.post(self.issues_url(), [
+            {'name': 'Première', 'description': 'Description'},
+            {'name': 'Seconde', 'description': 'Description', 'assignee_username': 'alice'},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(Issue.objects.filter(project=self.project, author=self.member).count(), 2)
+
+    def test_bulk_create_rejects_non_contributor_assignee(self):
+        self.client.force_authenticate(self.member)
+        response = self.client.post(self.issues_url(), [
+            {'name': 'Première', 'description': 'Description'},
+            {'name': 'Seconde', 'description': 'Description', 'assignee_username': 'carol'},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Issue.objects.exists())
+
+    def test_moving_an_issue_moves_its_comments(self):
+        issue = self.create_issue()
+        comment = Comment.objects.create(description='Commentaire', issue=issue, author=self.author)
+        self.assertEqual(comment.project_id, self.project.pk)
+        other = Project.objects.create(
+            name='Autre', description='Description', type=Project.Type.IOS, author=self.author
+        )
+        issue = Issue.objects.get(pk=issue.pk)
+        issue.project = other
+        issue.save()
+        comment.refresh_from_db()
+        self.assertEqual(comment.project_id, other.pk)
+
+
+class ListTests(SoftDeskAPITestCase):
+    """Pagination par curseur et sérialisation des listes."""
+
+    def test_cursor_pagination_walks_every_issue_once(self):
+        for number in range(25):
+            self.create_issue(name=f'Issue {number}')
+        self.client.force_authenticate(self.author)
+        response = self.client.get(self.issues_url())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first = response.json()
+        self.assertNotIn('count', first)
+        self.assertEqual(len(first['results']), 20)
+        second = self.client.get(first['next']).json()
+        self.assertEqual(len(second['results']), 5)
+        self.assertIsNone(second['next'])
+
+        ids = [issue['id'] for issue in first['results'] + second['results']]
+        self.assertEqual(len(set(ids)), 25)
+        created = [issue['created_time'] for issue in first['results'] + second['results']]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_comment_list_matches_detail(self):
+        issue = self.create_issue()
+        comment = Comment.objects.create(description='Commentaire', issue=issue, author=self.author)
+        self.client.force_authenticate(self.member)
+        row = self.client.get(self.comments_url(issue)).json()['results'][0]
+        detail = self.client.get(reverse('comments-detail', kwargs={
+            'project_pk': self.project.pk, 'issue_pk': issue.pk, 'pk': comment.pk
+        })).json()
+        self.assertEqual(row, detail)
+        self.assertEqual(list(row), CommentSerializer.Meta.fields)
+
+    def test_cached_serializer_fields_are_not_shared(self):
+        first, second = UserSerializer(), UserSerializer()
+        first.fields['username'].validators.append(lambda value: None)
+        self.assertNotEqual(
+            len(first.fields['username'].validators), len(second.fields['username'].validators)
+        )
+        first.fields.pop('email')
+        self.assertIn('email', UserSerializer().fields)
@@ -61,7 +61,8 @@ urlpatterns = [
     # Liste et création des issues d'un projet
     path('projects/<int:project_pk>/issues/', views.IssueViewSet.as_view({
         'get': 'list',           # GET /projects/{project_id}/issues/
-        'post': 'create'         # POST /projects/{project_id}/issues/
+        'post': 'create',        # POST /projects/{project_id}/issues/
+        'patch': 'bulk_update'   # PATCH /projects/{project_id}/issues/ - Modifier en lot
     }), name='issues-list'),
 
     # Détail, modification et suppression d'une issue
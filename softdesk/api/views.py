@@ -4,20 +4,26 @@ Gère l'authentification, les projets, contributeurs, issues et commentaires
 Documentation Swagger externalisée dans swagger_docs.py
 """
 
+import orjson
 from rest_framework import status, generics, viewsets, permissions
 from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
-from .models import User, Project, Contributor, Issue, Comment
+from .models import User, Contributor, Issue, Comment
 from .serializers import (
     UserSerializer, LoginSerializer, ProjectSerializer,
     ContributorSerializer, ContributorCreateSerializer,
-    IssueSerializer, IssueCreateSerializer, IssueUpdateSerializer,
-    CommentSerializer, CommentCreateSerializer, CommentUpdateSerializer
+    IssueSerializer, IssueCreateSerializer, IssueUpdateSerializer, IssueBulkUpdateSerializer,
+    CommentSerializer, CommentCreateSerializer, CommentUpdateSerializer,
+    CONTRIBUTOR_VALUES, serialize_contributor_rows,
+    COMMENT_VALUES, serialize_comment_rows,
+    PROJECT_VALUES, serialize_project_rows, requested_fields
 )
 
 # Import de la documentation Swagger
@@ -27,20 +33,41 @@ from .swagger_docs import (
     project_update_docs, project_partial_update_docs, project_destroy_docs,
     contributor_list_docs, contributor_add_docs, contributor_remove_docs,
     issue_list_docs, issue_create_docs, issue_retrieve_docs,
-    issue_update_docs, issue_partial_update_docs, issue_destroy_docs,
+    issue_update_docs, issue_partial_update_docs, issue_bulk_update_docs, issue_destroy_docs,
     comment_list_docs, comment_create_docs, comment_retrieve_docs,
     comment_update_docs, comment_partial_update_docs, comment_destroy_docs,
     rgpd_export_docs, rgpd_delete_docs
 )
 
 # Import des permissions personnalisées
-from .permissions import IsContributor, IsAuthorOrReadOnly
+from .permissions import IsContributor, IsAuthorOrReadOnly, projects_with_membership
 
 
 # ================================
 # AUTHENTIFICATION
 # ================================
 
+def tokens_for_user(user):
+    """
+    Génère la paire de tokens JWT (refresh + access) d'un utilisateur.
+
+    OPTIMISATION: Le token d'accès est dérivé des claims du token de
+    rafraîchissement, sans requête : seules deux signatures HMAC (HS256)
+    sont calculées.
+
+    Args:
+        user (User): L'utilisateur authentifié
+
+    Returns:
+        dict: Tokens 'refresh' et 'access' encodés
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
+
+
 class RegisterView(generics.CreateAPIView):
     """
     Inscription d'un nouvel utilisateur avec génération automatique de tokens JWT.
@@ -59,12 +86,9 @@ class RegisterView(generics.CreateAPIView):
         user = serializer.save()
 
         # Génération des tokens JWT
-        refresh = RefreshToken.for_user(user)
-
         return Response({
             'user': UserSerializer(user).data,
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
+            **tokens_for_user(user),
         }, status=status.HTTP_201_CREATED)
 
 
@@ -84,12 +108,10 @@ def login_view(request):
     serializer = LoginSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.validated_data['user']
-        refresh = RefreshToken.for_user(user)
 
         return Response({
             'user': UserSerializer(user).data,
-            'refresh': str(refresh),
-            'access': str(refresh.access_token),
+            **tokens_for_user(user),
         })
 
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -127,35 +149,42 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """
-        OPTIMISATION: Requêtes optimisées avec select_related et prefetch_related.
+        OPTIMISATION: Seul l'auteur est joint (voir ProjectSerializer.setup_eager_loading) :
+        ProjectSerializer n'affiche ni contributeurs, ni issues, ni commentaires,
+        aucun préchargement n'est donc nécessaire. L'appartenance (is_member) est
+        annotée pour que IsContributor n'ait pas à la recalculer, et sert de filtre :
+        EXISTS (semi-jointure) au lieu d'une jointure sur les contributeurs + DISTINCT.
 
         Returns:
-            QuerySet: Projets où l'utilisateur est contributeur avec relations préchargées
+            QuerySet: Projets où l'utilisateur est contributeur, auteur joint
+            (ligne verrouillée pour la modification)
         """
-        return Project.objects.filter(
-            contributors__user=self.request.user
-        ).select_related('author').prefetch_related(
-            'contributors__user',
-            'issues__author',
-            'issues__assignee',
-            'issues__comments__author'
-        ).distinct()
+        queryset = projects_with_membership(self.request).filter(is_member=True)
+        if self.action in ('update', 'partial_update'):
+            # Verrou sur la ligne du projet seule : pas de mise à jour perdue
+            # entre lecture et écriture (le compteur n'est jamais écrit par save())
+            queryset = queryset.select_for_update(of=('self',))
+        return ProjectSerializer.setup_eager_loading(queryset)
 
     @project_list_docs
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        # OPTIMISATION: Projection values() (une jointure sur l'auteur) sérialisée
+        # sans instancier de modèles ; appartenance filtrée par EXISTS
+        rows = projects_with_membership(request).filter(is_member=True).values(*PROJECT_VALUES)
+        fields = requested_fields(request)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_project_rows(page, fields))
+        return Response(serialize_project_rows(rows, fields))
 
     @project_create_docs
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # L'utilisateur connecté devient l'auteur
+        # L'utilisateur connecté devient l'auteur (et contributeur, voir ProjectSerializer.create)
         project = serializer.save(author=request.user)
 
-        # Ajouter l'auteur comme contributeur (éviter les doublons avec get_or_create)
-        Contributor.objects.get_or_create(project=project, user=request.user)
-
         return Response(
             ProjectSerializer(project).data,
             status=status.HTTP_201_CREATED
@@ -166,10 +195,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return super().retrieve(request, *args, **kwargs)
 
     @project_update_docs
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
     @project_partial_update_docs
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         return super().partial_update(request, *args, **kwargs)
 
@@ -200,9 +231,9 @@ class ContributorViewSet(viewsets.ModelViewSet):
             QuerySet: Contributeurs du projet avec relations préchargées
         """
         project_id = self.kwargs['project_pk']
-        return Contributor.objects.filter(
-            project_id=project_id
-        ).select_related('user', 'project')
+        return ContributorSerializer.setup_eager_loading(
+            Contributor.objects.filter(project_id=project_id)
+        )
 
     def get_project(self):
         """
@@ -216,10 +247,13 @@ class ContributorViewSet(viewsets.ModelViewSet):
             PermissionError: Si l'utilisateur n'est pas contributeur
         """
         project_id = self.kwargs['project_pk']
-        project = get_object_or_404(Project, id=project_id)
+        # OPTIMISATION: Projet et appartenance lus en une seule requête
+        project = get_object_or_404(projects_with_membership(self.request), id=project_id)
+        # Projet annoté conservé pour IsContributor (pas de seconde requête d'appartenance)
+        self.project = project
 
         # SECURITY: Vérifier que l'utilisateur est contributeur
-        if not project.contributors.filter(user=self.request.user).exists():
+        if not project.is_member:
             raise PermissionError("Vous n'êtes pas contributeur de ce projet")
 
         return project
@@ -228,7 +262,14 @@ class ContributorViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         try:
             self.get_project()
-            return super().list(request, *args, **kwargs)
+            # OPTIMISATION: Projection values() sérialisée sans instancier de modèles
+            rows = Contributor.objects.filter(
+                project_id=self.kwargs['project_pk']
+            ).values(*CONTRIBUTOR_VALUES)
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                return self.get_paginated_response(serialize_contributor_rows(page))
+            return Response(serialize_contributor_rows(rows))
         except PermissionError as e:
             return Response(
                 {"error": str(e)},
@@ -241,13 +282,16 @@ class ContributorViewSet(viewsets.ModelViewSet):
             project = self.get_project()
 
             # SECURITY: Seul l'auteur peut ajouter des contributeurs
-            if project.author != request.user:
+            if project.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur du projet peut ajouter des contributeurs"},
                     status=status.HTTP_403_FORBIDDEN
                 )
 
-            serializer = ContributorCreateSerializer(data=request.data)
+            # Un tableau de usernames est ajouté en lot (voir ContributorListCreateSerializer)
+            serializer = ContributorCreateSerializer(
+                data=request.data, many=isinstance(request.data, list)
+            )
             if serializer.is_valid():
                 serializer.save(project=project)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -265,7 +309,7 @@ class ContributorViewSet(viewsets.ModelViewSet):
             project = self.get_project()
 
             # SECURITY: Seul l'auteur peut retirer des contributeurs
-            if project.author != request.user:
+            if project.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur du projet peut retirer des contributeurs"},
                     status=status.HTTP_403_FORBIDDEN
@@ -274,10 +318,10 @@ class ContributorViewSet(viewsets.ModelViewSet):
             # Récupérer le contributeur par user_id (pas contributor_id)
             user_id = kwargs.get('pk')  # L'URL contient user_id
             try:
-                contributor = Contributor.objects.get(
-                    user_id=user_id,
-                    project=project
-                )
+                # OPTIMISATION: Seules les colonnes nécessaires à la suppression
+                contributor = Contributor.objects.only(
+                    'id', 'user', 'project'
+                ).get(user_id=user_id, project=project)
             except Contributor.DoesNotExist:
                 return Response(
                     {"error": "Cet utilisateur n'est pas contributeur de ce projet"},
@@ -285,7 +329,7 @@ class ContributorViewSet(viewsets.ModelViewSet):
                 )
 
             # Empêcher la suppression de l'auteur
-            if contributor.user == project.author:
+            if contributor.user_id == project.author_id:
                 return Response(
                     {"error": "L'auteur du projet ne peut pas être retiré"},
                     status=status.HTTP_400_BAD_REQUEST
@@ -318,14 +362,22 @@ class IssueViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         OPTIMISATION: Requêtes optimisées.
+        Pour la suppression, seules les colonnes utilisées par les contrôles
+        d'accès sont chargées (pas de description ni de jointures).
+        Pour la modification, l'issue est verrouillée (SELECT ... FOR UPDATE)
+        jusqu'à la fin de la transaction, ce qui évite les mises à jour perdues.
 
         Returns:
             QuerySet: Issues du projet avec relations préchargées
         """
         project_id = self.kwargs['project_pk']
-        return Issue.objects.filter(
-            project_id=project_id
-        ).select_related('author', 'assignee', 'project').prefetch_related('comments')
+        queryset = Issue.objects.filter(project_id=project_id)
+        if self.action == 'destroy':
+            return queryset.only('id', 'author', 'project')
+        if self.action in ('update', 'partial_update'):
+            # Verrou sur la ligne de l'issue seule (pas sur les lignes jointes)
+            queryset = queryset.select_for_update(of=('self',))
+        return IssueSerializer.setup_eager_loading(queryset)
 
     def get_project(self):
         """
@@ -339,10 +391,13 @@ class IssueViewSet(viewsets.ModelViewSet):
             PermissionError: Si l'utilisateur n'est pas contributeur
         """
         project_id = self.kwargs['project_pk']
-        project = get_object_or_404(Project, id=project_id)
+        # OPTIMISATION: Projet et appartenance lus en une seule requête
+        project = get_object_or_404(projects_with_membership(self.request), id=project_id)
+        # Projet annoté conservé pour IsContributor (pas de seconde requête d'appartenance)
+        self.project = project
 
         # SECURITY: Vérifier que l'utilisateur est contributeur
-        if not project.contributors.filter(user=self.request.user).exists():
+        if not project.is_member:
             raise PermissionError("Vous n'êtes pas contributeur de ce projet")
 
         return project
@@ -362,15 +417,18 @@ class IssueViewSet(viewsets.ModelViewSet):
     def create(self, request, *args, **kwargs):
         try:
             project = self.get_project()
+            # Un tableau d'issues est créé en lot (voir IssueListCreateSerializer)
+            many = isinstance(request.data, list)
             serializer = IssueCreateSerializer(
                 data=request.data,
+                many=many,
                 context={'project': project, 'request': request}
             )
 
             if serializer.is_valid():
                 issue = serializer.save()
                 return Response(
-                    IssueSerializer(issue).data,
+                    IssueSerializer(issue, many=many).data,
                     status=status.HTTP_201_CREATED
                 )
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -393,13 +451,14 @@ class IssueViewSet(viewsets.ModelViewSet):
             )
 
     @issue_update_docs
+    @transaction.atomic
     def update(self, request, *args, **kwargs):
         try:
             project = self.get_project()
             issue = self.get_object()
 
             # SECURITY: Seul l'auteur de l'issue peut la modifier (ou l'auteur du projet)
-            if issue.author != request.user and project.author != request.user:
+            if issue.author_id != request.user.id and project.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur de l'issue ou du projet peut la modifier"},
                     status=status.HTTP_403_FORBIDDEN
@@ -418,13 +477,14 @@ class IssueViewSet(viewsets.ModelViewSet):
             )
 
     @issue_partial_update_docs
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         try:
             project = self.get_project()
             issue = self.get_object()
 
             # SECURITY: Seul l'auteur de l'issue peut la modifier (ou l'auteur du projet)
-            if issue.author != request.user and project.author != request.user:
+            if issue.author_id != request.user.id and project.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur de l'issue ou du projet peut la modifier"},
                     status=status.HTTP_403_FORBIDDEN
@@ -442,6 +502,50 @@ class IssueViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
+    @issue_bulk_update_docs
+    @transaction.atomic
+    def bulk_update(self, request, *args, **kwargs):
+        try:
+            project = self.get_project()
+            serializer = IssueBulkUpdateSerializer(
+                data=request.data,
+                context={'project': project, 'request': request}
+            )
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+            # Issues désignées, verrouillées jusqu'à l'UPDATE (même transaction)
+            ids = set(serializer.validated_data['ids'])
+            authors = dict(
+                Issue.objects.select_for_update().filter(project=project, pk__in=ids)
+                .values_list('pk', 'author_id')
+            )
+
+            unknown = sorted(ids - authors.keys())
+            if unknown:
+                return Response(
+                    {"error": "Issues introuvables dans ce projet", "ids": unknown},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # SECURITY: L'auteur du projet modifie toutes les issues, les autres
+            # contributeurs uniquement celles dont ils sont l'auteur
+            if project.author_id != request.user.id:
+                forbidden = sorted(pk for pk, author_id in authors.items() if author_id != request.user.id)
+                if forbidden:
+                    return Response(
+                        {"error": "Seul l'auteur de l'issue ou du projet peut la modifier", "ids": forbidden},
+                        status=status.HTTP_403_FORBIDDEN
+                    )
+
+            return Response({"updated": serializer.apply_to(Issue.objects.filter(pk__in=ids))})
+
+        except PermissionError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
     @issue_destroy_docs
     def destroy(self, request, *args, **kwargs):
         try:
@@ -449,7 +553,7 @@ class IssueViewSet(viewsets.ModelViewSet):
             issue = self.get_object()
 
             # SECURITY: Seul l'auteur de l'issue peut la supprimer (ou l'auteur du projet)
-            if issue.author != request.user and project.author != request.user:
+            if issue.author_id != request.user.id and project.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur de l'issue ou du projet peut la supprimer"},
                     status=status.HTTP_403_FORBIDDEN
@@ -482,14 +586,17 @@ class CommentViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         OPTIMISATION: Requêtes optimisées.
+        Pour la suppression, seules les colonnes utilisées par les contrôles
+        d'accès sont chargées (pas de description ni de jointures).
 
         Returns:
             QuerySet: Commentaires de l'issue avec relations préchargées
         """
         issue_id = self.kwargs['issue_pk']
-        return Comment.objects.filter(
-            issue_id=issue_id
-        ).select_related('author', 'issue__project')
+        queryset = Comment.objects.filter(issue_id=issue_id)
+        if self.action == 'destroy':
+            return queryset.only('id', 'author', 'project')
+        return CommentSerializer.setup_eager_loading(queryset)
 
     def get_issue(self):
         """
@@ -505,11 +612,16 @@ class CommentViewSet(viewsets.ModelViewSet):
         project_id = self.kwargs['project_pk']
         issue_id = self.kwargs['issue_pk']
 
-        project = get_object_or_404(Project, id=project_id)
+        # OPTIMISATION: Projet et appartenance lus en une seule requête
+        project = get_object_or_404(projects_with_membership(self.request), id=project_id)
+        # Projet annoté conservé pour IsContributor (pas de seconde requête d'appartenance)
+        self.project = project
         issue = get_object_or_404(Issue, id=issue_id, project=project)
+        # Le projet annoté est rattaché à l'issue (ni rechargement, ni nouvelle vérification)
+        issue.project = project
 
         # SECURITY: Vérifier que l'utilisateur est contributeur
-        if not project.contributors.filter(user=self.request.user).exists():
+        if not project.is_member:
             raise PermissionError("Vous n'êtes pas contributeur de ce projet")
 
         return issue
@@ -518,7 +630,12 @@ class CommentViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         try:
             self.get_issue()
-            return super().list(request, *args, **kwargs)
+            # OPTIMISATION: Projection values() sérialisée sans instancier de modèles
+            rows = Comment.objects.filter(issue_id=self.kwargs['issue_pk']).values(*COMMENT_VALUES)
+            page = self.paginate_queryset(rows)
+            if page is not None:
+                return self.get_paginated_response(serialize_comment_rows(page))
+            return Response(serialize_comment_rows(rows))
         except PermissionError as e:
             return Response(
                 {"error": str(e)},
@@ -531,7 +648,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             issue = self.get_issue()
             serializer = CommentCreateSerializer(
                 data=request.data,
-                context={'issue': issue, 'request': request}
+                context={'issue': issue, 'project': self.project, 'request': request}
             )
 
             if serializer.is_valid():
@@ -566,7 +683,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             comment = self.get_object()
 
             # SECURITY: Seul l'auteur du commentaire peut le modifier
-            if comment.author != request.user:
+            if comment.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur du commentaire peut le modifier"},
                     status=status.HTTP_403_FORBIDDEN
@@ -591,7 +708,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             comment = self.get_object()
 
             # SECURITY: Seul l'auteur du commentaire peut le modifier
-            if comment.author != request.user:
+            if comment.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur du commentaire peut le modifier"},
                     status=status.HTTP_403_FORBIDDEN
@@ -616,7 +733,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             comment = self.get_object()
 
             # SECURITY: Seul l'auteur du commentaire peut le supprimer
-            if comment.author != request.user:
+            if comment.author_id != request.user.id:
                 return Response(
                     {"error": "Seul l'auteur du commentaire peut le supprimer"},
                     status=status.HTTP_403_FORBIDDEN
@@ -636,6 +753,27 @@ class CommentViewSet(viewsets.ModelViewSet):
 # RGPD - CONFORMITÉ
 # ================================
 
+def _stream_export(header, sections, trailer):
+    """
+    Produit par morceaux un document JSON d'export RGPD.
+
+    Args:
+        header (dict): Informations de l'utilisateur (clé 'user_info')
+        sections (list): Couples (clé, queryset values()) exportés en tableaux
+        trailer (dict): Clés finales du document (date d'export, mention RGPD)
+
+    Yields:
+        bytes: Morceaux successifs du document JSON
+    """
+    yield b'{"user_info":' + orjson.dumps(header)
+    for key, rows in sections:
+        yield b',' + orjson.dumps(key) + b':['
+        for index, row in enumerate(rows.iterator(chunk_size=500)):
+            yield (b',' if index else b'') + orjson.dumps(row, option=orjson.OPT_UTC_Z)
+        yield b']'
+    yield b',' + orjson.dumps(trailer)[1:]
+
+
 class GDPRViewSet(viewsets.ViewSet):
     """
     RGPD: Endpoints pour la conformité RGPD.
@@ -656,33 +794,39 @@ class GDPRViewSet(viewsets.ViewSet):
             request: Requête HTTP avec utilisateur authentifié
 
         Returns:
-            Response: Toutes les données personnelles de l'utilisateur en JSON
+            StreamingHttpResponse: Toutes les données personnelles de l'utilisateur en JSON
         """
         user = request.user
 
-        # Collecter toutes les données utilisateur
-        data = {
-            'user_info': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'date_of_birth': user.date_of_birth.isoformat() if user.date_of_birth else None,
-                'can_be_contacted': user.can_be_contacted,
-                'can_data_be_shared': user.can_data_be_shared,
-                'created_time': user.created_time.isoformat(),
-            },
-            'projects_authored': list(user.authored_projects.values('id', 'name', 'created_time')),
-            'contributions': list(user.contributions.values('project__name', 'created_time')),
-            'issues_authored': list(user.authored_issues.values('name', 'created_time', 'project__name')),
-            'issues_assigned': list(user.assigned_issues.values('name', 'created_time', 'project__name')),
-            'comments_authored': list(user.authored_comments.values('description', 'created_time', 'issue__name')),
+        # OPTIMISATION: Le document JSON est produit au fil de l'eau ; chaque liste
+        # est lue par paquets (iterator), la mémoire ne dépend plus du volume exporté
+        user_info = {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'date_of_birth': user.date_of_birth.isoformat() if user.date_of_birth else None,
+            'can_be_contacted': user.can_be_contacted,
+            'can_data_be_shared': user.can_data_be_shared,
+            'created_time': user.created_time.isoformat(),
+        }
+        sections = [
+            ('projects_authored', user.authored_projects.values('id', 'name', 'created_time')),
+            ('contributions', user.contributions.values('project__name', 'created_time')),
+            ('issues_authored', user.authored_issues.values('name', 'created_time', 'project__name')),
+            ('issues_assigned', user.assigned_issues.values('name', 'created_time', 'project__name')),
+            ('comments_authored', user.authored_comments.values('description', 'created_time', 'issue__name')),
+        ]
+        trailer = {
             'export_date': timezone.now().isoformat(),
             'rgpd_notice': 'Données exportées conformément à l\'Article 15 du RGPD'
         }
 
-        response = Response(data)
+        response = StreamingHttpResponse(
+            _stream_export(user_info, sections, trailer),
+            content_type='application/json'
+        )
         response['Content-Disposition'] = (
             f'attachment; filename="donnees_personnelles_{user.username}_'
             f'{timezone.now().strftime("%Y%m%d")}.json"'
@@ -53,6 +53,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # OPTIMISATION: Compression gzip des réponses (hors authentification, voir api/middleware.py)
+    'api.middleware.SelectiveGZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -143,7 +145,13 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # OPTIMISATION: Encodage JSON des réponses avec orjson (voir api/renderers.py)
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # OPTIMISATION: Pagination par curseur sur created_time (voir api/pagination.py)
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.CreatedTimeCursorPagination',
     'PAGE_SIZE': 20
 }
 
@@ -151,6 +159,8 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    # OPTIMISATION: Signature HMAC symétrique, la moins coûteuse (pas de RSA)
+    'ALGORITHM': 'HS256',
 }
 
 # Configuration pour drf-yasg
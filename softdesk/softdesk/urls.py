@@ -32,6 +32,11 @@ schema_view = get_schema_view(
     authentication_classes=[],
 )
 
+# OPTIMISATION: Le schéma (public, identique pour tous) est généré une fois
+# puis servi depuis le cache, au lieu d'introspecter tous les serializers
+# à chaque affichage de la documentation
+SCHEMA_CACHE_TIMEOUT = 60 * 15
+
 urlpatterns = [
     # Administration Django
     path('admin/', admin.site.urls),
@@ -41,14 +46,14 @@ urlpatterns = [
 
     # === DOCUMENTATION API ===
     # Interface Swagger UI (interactive)
-    path('doc/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
+    path('doc/', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-swagger-ui'),
 
     # Interface ReDoc (documentation lisible)
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-redoc'),
 
     # Schéma JSON brut
-    path('swagger.json', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+    path('swagger.json', schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-json'),
 
     # Schéma YAML brut
-    path('swagger.yaml', schema_view.without_ui(cache_timeout=0), name='schema-yaml'),
+    path('swagger.yaml', schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-yaml'),
 ]